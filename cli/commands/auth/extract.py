@@ -129,7 +129,7 @@ def _extract_headers_by_name(
 ) -> dict[str, str] | None:
     """Given header names, find the most recent trace with those headers and return values."""
     filtered = _filter_traces_by_base_url(traces, base_url)
-    names_lower = [n.lower() for n in names]
+    names_lower = frozenset(n.lower() for n in names)
 
     for trace in filtered:
         headers: dict[str, str] = {}
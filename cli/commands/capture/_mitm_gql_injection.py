@@ -10,6 +10,7 @@ mitmproxy ``HTTPFlow``, detecting JSON bodies that look like GraphQL.
 
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 from typing import TYPE_CHECKING, Any, cast
 
@@ -17,14 +18,21 @@ if TYPE_CHECKING:
     from mitmproxy.http import HTTPFlow
 
 
+@lru_cache(maxsize=512)
 def inject_typename(query_str: str) -> str:
     """Inject ``__typename`` into every selection set of a GraphQL query.
 
-    If the query cannot be parsed, returns it unchanged.
+    If the query cannot be parsed, returns it unchanged.  Results are
+    memoized: apps send the same handful of operations over and over.
 
     >>> inject_typename("{ user { name } }")
     '{\\n  user {\\n    name\\n    __typename\\n  }\\n  __typename\\n}'
     """
+    # Every executable GraphQL document has a selection set; anything
+    # without a brace would fail to parse anyway.
+    if "{" not in query_str:
+        return query_str
+
     from graphql import parse as gql_parse, print_ast
     from graphql.error import GraphQLSyntaxError
     from graphql.language.ast import FieldNode, NameNode, SelectionSetNode
@@ -71,7 +79,9 @@ def inject_typename_into_flow(flow: HTTPFlow) -> None:
         return
 
     body_bytes = req.content
-    if not body_bytes:
+    # Most JSON POSTs are plain REST payloads; skip parsing them unless a
+    # "query" key could be present.
+    if not body_bytes or b'"query"' not in body_bytes:
         return
 
     try:
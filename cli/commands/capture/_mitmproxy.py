@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
 import re
 import signal
 import threading
@@ -26,18 +27,27 @@ from cli.formats.capture_bundle import (
 )
 
 
-def _header_items(headers: mitmproxy_Headers) -> list[tuple[str, str]]:
-    """Extract header items from mitmproxy Headers, typed for pyright."""
-    items: list[tuple[str, str]] = list(headers.items(multi=True))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+def _header_items(headers: mitmproxy_Headers) -> Iterator[tuple[str, str]]:
+    """Iterate header items from mitmproxy Headers, typed for pyright."""
+    items: Iterator[tuple[str, str]] = iter(headers.items(multi=True))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportUnknownVariableType]
     return items
 
 
+def _to_headers(headers: mitmproxy_Headers) -> list[Header]:
+    """Build Header models from mitmproxy Headers in a single pass.
+
+    mitmproxy already hands back ``str`` names and values, so pydantic
+    validation is skipped with ``model_construct``.
+    """
+    return [Header.model_construct(name=k, value=v) for k, v in _header_items(headers)]
+
+
 def flow_to_trace(flow: HTTPFlow, trace_id: str) -> Trace:
     """Convert a mitmproxy HTTPFlow to a Trace."""
     req = flow.request
     resp = flow.response
 
-    req_headers = [Header(name=k, value=v) for k, v in _header_items(req.headers)]
+    req_headers = _to_headers(req.headers)
     req_body = req.content or b""
 
     resp_headers: list[Header] = []
@@ -45,7 +55,7 @@ def flow_to_trace(flow: HTTPFlow, trace_id: str) -> Trace:
     status = 0
     status_text = ""
     if resp:
-        resp_headers = [Header(name=k, value=v) for k, v in _header_items(resp.headers)]
+        resp_headers = _to_headers(resp.headers)
         resp_body = resp.content or b""
         status = resp.status_code
         status_text = resp.reason or ""
@@ -168,17 +178,16 @@ def run_mitmproxy(
 
     start_time = time.time()
 
-    def _shutdown() -> None:
-        loop.call_soon_threadsafe(master.shutdown)
-        proxy_thread.join(timeout=10)
-
     def _sigint_handler(signum: int, frame: FrameType | None) -> None:
-        _shutdown()
-
-    signal.signal(signal.SIGINT, _sigint_handler)
+        loop.call_soon_threadsafe(master.shutdown)
 
-    while proxy_thread.is_alive():
-        proxy_thread.join(timeout=1)
+    # On POSIX a blocking join() is interrupted to run the handler, then
+    # resumes until the proxy loop has actually exited.
+    previous_handler = signal.signal(signal.SIGINT, _sigint_handler)
+    try:
+        proxy_thread.join()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
 
     end_time = time.time()
     return start_time, end_time
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
+import sys
 import threading
 from typing import TYPE_CHECKING
 import uuid
@@ -127,7 +128,7 @@ class CaptureAddon:
             console.print(f"  [dim]App:[/dim] {current}")
             self._last_logged_app = current
         self.traces.append(trace)
-        self.domains_seen.add(flow.request.host)
+        self.domains_seen.add(sys.intern(flow.request.host))
 
     def build_bundles_by_app(
         self, start_time: float, end_time: float
@@ -151,7 +152,7 @@ class CaptureAddon:
                 for trace in traces
                 if "/" in trace.meta.request.url
             }
-            base_url = f"https://{sorted(domains)[0]}" if domains else ""
+            base_url = f"https://{min(domains)}" if domains else ""
 
             manifest = CaptureManifest(
                 capture_id=str(uuid.uuid4()),
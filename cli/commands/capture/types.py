@@ -23,7 +23,7 @@ from cli.formats.capture_bundle import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Trace:
     """An HTTP trace with its request/response bodies loaded into memory."""
 
@@ -32,7 +32,7 @@ class Trace:
     response_body: bytes = b""
 
 
-@dataclass
+@dataclass(slots=True)
 class WsMessage:
     """A single WebSocket message with its payload."""
 
@@ -40,7 +40,7 @@ class WsMessage:
     payload: bytes = b""
 
 
-@dataclass
+@dataclass(slots=True)
 class WsConnection:
     """A WebSocket connection with all its messages."""
 
@@ -48,7 +48,7 @@ class WsConnection:
     messages: list[WsMessage] = field(default_factory=lambda: list[WsMessage]())
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """A UI context snapshot."""
 
@@ -8,6 +8,8 @@ import click
 
 from cli.helpers.console import console
 
+_COLLECTION_REF_RE = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$")
+
 
 @click.command()
 @click.argument("collection_ref")
@@ -27,7 +29,7 @@ def install(collection_ref: str) -> None:
         write_tools,
     )
 
-    if not re.match(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$", collection_ref):
+    if not _COLLECTION_REF_RE.match(collection_ref):
         raise click.ClickException(
             f"Invalid collection reference: '{collection_ref}'. "
             "Expected format: <user>/<app>"
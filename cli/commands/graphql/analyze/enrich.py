@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from cli.commands.capture.types import Trace
@@ -31,7 +32,9 @@ def enrich_graphql(
     - Where this type appears in the schema (observed_paths)
     - Sample observed values per field
 
-    The LLM returns a description for the type and each field.
+    The LLM returns a description for the type and each field.  Calls are
+    independent, so they run concurrently on one event loop, at most
+    ``llm.MAX_CONCURRENT_CALLS`` at a time.
     """
     registry = schema_data.registry
 
@@ -53,15 +56,19 @@ def enrich_graphql(
     # Enrich enums too
     enums_to_enrich = [e for e in registry.enums.values() if e.values]
 
-    for t in types_to_enrich:
-        _enrich_type(t, app_name)
-    for e in enums_to_enrich:
-        _enrich_enum(e.name, e.values, app_name, registry)
-
+    asyncio.run(
+        llm.gather_bounded(
+            [_enrich_type(t, app_name) for t in types_to_enrich]
+            + [
+                _enrich_enum(e.name, e.values, app_name, registry)
+                for e in enums_to_enrich
+            ]
+        )
+    )
     return schema_data
 
 
-def _enrich_type(type_rec: TypeRecord, app_name: str) -> None:
+async def _enrich_type(type_rec: TypeRecord, app_name: str) -> None:
     summary = _build_type_summary(type_rec)
     prompt = render(
         "graphql-enrich-type.j2",
@@ -71,7 +78,7 @@ def _enrich_type(type_rec: TypeRecord, app_name: str) -> None:
 
     try:
         conv = llm.Conversation(max_tokens=1024, label=f"enrich_gql_{type_rec.name}")
-        result = conv.ask_json(prompt, TypeEnrichmentResponse)
+        result = await conv.ask_json_async(prompt, TypeEnrichmentResponse)
         _apply_type_enrichment(type_rec, result)
     except Exception as exc:
         console.print(
@@ -80,7 +87,7 @@ def _enrich_type(type_rec: TypeRecord, app_name: str) -> None:
         )
 
 
-def _enrich_enum(
+async def _enrich_enum(
     enum_name: str,
     enum_values: set[str],
     app_name: str,
@@ -96,7 +103,7 @@ def _enrich_enum(
 
     try:
         conv = llm.Conversation(max_tokens=256, label=f"enrich_gql_enum_{enum_name}")
-        result = conv.ask_json(prompt, EnumEnrichmentResponse)
+        result = await conv.ask_json_async(prompt, EnumEnrichmentResponse)
         registry.enums[enum_name].description = result.description
     except Exception:
         pass
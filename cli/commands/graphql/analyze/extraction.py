@@ -112,12 +112,12 @@ def extract_graphql_schema(traces: list[Trace]) -> GraphQLSchemaData:
 
     operations = parse_graphql_traces(traces)
 
-    # Build a lookup from trace body hash to response body for matching
-    trace_responses = _build_trace_response_map(traces)
+    # Build a lookup from query string to response body for matching
+    responses_by_query = _index_responses_by_query(_build_trace_response_map(traces))
 
     for op in operations:
         # Find the matching response by looking up the trace
-        response_data = _find_response_for_operation(op, trace_responses)
+        response_data = _find_response_for_operation(op, responses_by_query)
 
         # Determine root type name
         root_type_name = _root_type_for_operation(op.type)
@@ -187,26 +187,35 @@ def _build_trace_response_map(
     return result
 
 
-def _find_response_for_operation(
-    op: ParsedOperation,
+def _index_responses_by_query(
     trace_responses: dict[str, dict[str, Any]],
-) -> dict[str, Any] | None:
-    """Find the response data matching an operation.
+) -> dict[str, dict[str, Any]]:
+    """Map each raw query string to the response of the first body sending it.
 
-    Searches by matching the raw query string in request body keys.
+    Each request body is parsed once here, so matching an operation is a
+    dict lookup instead of re-parsing every body per operation.
     """
+    index: dict[str, dict[str, Any]] = {}
     for key, response in trace_responses.items():
         try:
             body = json.loads(key)
-            if isinstance(body, dict) and cast(dict[str, Any], body).get("query") == op.raw_query:
-                return response
-            if isinstance(body, list):
-                for item in cast(list[Any], body):
-                    if isinstance(item, dict) and cast(dict[str, Any], item).get("query") == op.raw_query:
-                        return response
         except (json.JSONDecodeError, ValueError):
-            pass
-    return None
+            continue
+        items = cast(list[Any], body) if isinstance(body, list) else [body]
+        for item in items:
+            if isinstance(item, dict):
+                query = cast(dict[str, Any], item).get("query")
+                if isinstance(query, str):
+                    index.setdefault(query, response)
+    return index
+
+
+def _find_response_for_operation(
+    op: ParsedOperation,
+    responses_by_query: dict[str, dict[str, Any]],
+) -> dict[str, Any] | None:
+    """Find the response data matching an operation by its raw query string."""
+    return responses_by_query.get(op.raw_query)
 
 
 def _walk_fields(
@@ -21,13 +21,21 @@ if TYPE_CHECKING:
 @click.option(
     "--debug", is_flag=True, default=False, help="Save LLM prompts/responses to debug/"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Call the LLM instead of replaying cached responses (refreshes the cache).",
+)
 @click.option(
     "--skip-enrich",
     is_flag=True,
     default=False,
     help="Skip LLM enrichment step (business context, glossary, etc.)",
 )
-def analyze(app_name: str, output: str, debug: bool, skip_enrich: bool) -> None:
+def analyze(
+    app_name: str, output: str, debug: bool, no_cache: bool, skip_enrich: bool
+) -> None:
     """Analyze captures for an app and produce a GraphQL SDL schema."""
     from pathlib import Path
 
@@ -45,6 +53,7 @@ def analyze(app_name: str, output: str, debug: bool, skip_enrich: bool) -> None:
     )
 
     llm.init_debug(debug=debug)
+    llm.init_cache(refresh=no_cache)
 
     console.print(f"[bold]Analyzing with LLM ({llm.current_model()})...[/bold]")
     sdl = _run_graphql(bundle, app_name, skip_enrich)
@@ -84,7 +93,8 @@ def _run_graphql(
     gql_traces = [t for t in bundle.traces if t.meta.request.url.startswith(base_url)]
     console.print(f"  Kept {len(gql_traces)}/{len(bundle.traces)} traces under {base_url}")
 
-    correlations = correlate(bundle)
+    # Only enrichment reads the correlations.
+    correlations = [] if skip_enrich else correlate(bundle)
 
     sdl = graphql_analyze(
         gql_traces,
@@ -6,20 +6,28 @@ Pure functions — no I/O, no side effects.
 from __future__ import annotations
 
 from enum import Enum
+import re
 from typing import Any, cast
 from urllib.parse import urlencode
 
 from cli.formats.mcp_tool import ToolDefinition
 
+_URL_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
 
 def _resolve_url(url_template: str, params: dict[str, Any]) -> str:
-    """Substitute ``{param}`` placeholders in *url_template*."""
-    url = url_template
-    for key, value in params.items():
-        placeholder = f"{{{key}}}"
-        if placeholder in url:
-            url = url.replace(placeholder, str(value))
-    return url
+    """Substitute ``{param}`` placeholders in *url_template*.
+
+    Placeholders without a matching entry in *params* are left as-is.
+    """
+    if "{" not in url_template:
+        return url_template
+
+    def _substitute(m: re.Match[str]) -> str:
+        name = m.group(1)
+        return str(params[name]) if name in params else m.group(0)
+
+    return _URL_PLACEHOLDER_RE.sub(_substitute, url_template)
 
 
 def _resolve_query(query_template: dict[str, Any], params: dict[str, Any]) -> dict[str, str]:
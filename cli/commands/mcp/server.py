@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
@@ -12,9 +12,15 @@ from cli.formats.mcp_tool import ToolDefinition
 from cli.helpers.auth import AuthError, get_auth
 from cli.helpers.storage import list_apps, list_tools
 
+if TYPE_CHECKING:
+    import requests
+
 # Registry: MCP tool name -> (app_name, ToolDefinition)
 _registry: dict[str, tuple[str, ToolDefinition]] = {}
 
+# Shared HTTP session so successive tool calls reuse pooled connections.
+_http_session: requests.Session | None = None
+
 
 def _build_registry() -> None:
     """Scan all apps and register their tools."""
@@ -38,12 +44,28 @@ def _make_mcp_tool(mcp_name: str, tool: ToolDefinition) -> Any:
     )
 
 
+def _get_http_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use.
+
+    The session never stores cookies: auth comes exclusively from the
+    app's ``TokenState``, and responses from one app must not leak into
+    requests made for another.
+    """
+    global _http_session
+    if _http_session is None:
+        from http.cookiejar import DefaultCookiePolicy
+
+        import requests
+
+        _http_session = requests.Session()
+        _http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return _http_session
+
+
 async def _handle_call(
     app_name: str, tool: ToolDefinition, arguments: dict[str, Any]
 ) -> str:
     """Execute a tool call: build request, inject auth, make HTTP call."""
-    import requests
-
     # Auth cascade
     auth_headers: dict[str, str] = {}
     auth_body_params: dict[str, Any] = {}
@@ -68,7 +90,7 @@ async def _handle_call(
     )
 
     try:
-        resp = requests.request(
+        resp = _get_http_session().request(
             method=method,
             url=url,
             headers=headers,
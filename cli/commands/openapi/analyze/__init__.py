@@ -7,11 +7,7 @@ from typing import Any
 from cli.commands.capture.types import Trace
 from cli.commands.openapi.analyze.assemble import assemble_openapi
 from cli.commands.openapi.analyze.enrich import enrich_endpoints
-from cli.commands.openapi.analyze.extraction import (
-    extract_rate_limit,
-    find_traces_for_group,
-    mechanical_extraction,
-)
+from cli.commands.openapi.analyze.extraction import mechanical_extraction
 from cli.commands.openapi.analyze.group_endpoints import group_endpoints
 from cli.commands.openapi.analyze.strip_prefix import strip_prefix
 from cli.commands.openapi.analyze.types import (
@@ -34,7 +30,8 @@ def rest_analyze(
     skip_enrich: bool,
 ) -> dict[str, Any]:
     """Run the full REST analysis pipeline and return an OpenAPI 3.1 dict."""
-    # Phase A: Mechanical extraction (includes map resolution via analyze_schema)
+    # Phase A: Mechanical extraction (includes map resolution via analyze_schema
+    # and per-endpoint rate limits)
     endpoints, _ = _rest_extract(traces, base_url)
 
     # Phase B: Enrichment (optional)
@@ -74,20 +71,18 @@ def _rest_extract(
 ) -> tuple[list[EndpointSpec], list[EndpointGroup]]:
     """Run REST extraction pipeline up to (but not including) enrichment."""
     console.print("  Grouping URLs into endpoints (LLM)...")
-    filtered_pairs = [
-        MethodUrlPair(t.meta.request.method.upper(), t.meta.request.url)
-        for t in rest_traces
-    ]
-    endpoint_groups = group_endpoints(filtered_pairs)
+    # One pair per distinct (method, url), in first-seen order.
+    unique_pairs = list(
+        dict.fromkeys(
+            MethodUrlPair(t.meta.request.method.upper(), t.meta.request.url)
+            for t in rest_traces
+        )
+    )
+    endpoint_groups = group_endpoints(unique_pairs)
 
     endpoint_groups = strip_prefix(endpoint_groups, base_url)
 
     console.print(f"  Extracting {len(endpoint_groups)} endpoints...")
     endpoints = mechanical_extraction(endpoint_groups, rest_traces)
 
-    # Detect rate_limit per endpoint
-    for ep, group in zip(endpoints, endpoint_groups):
-        group_traces = find_traces_for_group(group, rest_traces)
-        ep.rate_limit = extract_rate_limit(group_traces)
-
     return endpoints, endpoint_groups
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, TypeGuard
 
-from cli.commands.capture.types import Trace
 from cli.commands.openapi.analyze.extraction import (
-    _match_traces_by_pattern,  # pyright: ignore[reportPrivateUsage]
+    TraceIndex,
+    index_by_method,
+    match_traces_by_pattern,
 )
 from cli.commands.openapi.analyze.types import (
     EndpointEnrichmentResponse,
@@ -24,15 +26,25 @@ _MAX_RESPONSE_SCHEMA_CHARS = 5_000
 
 
 def enrich_endpoints(ctx: EnrichmentContext) -> list[EndpointSpec]:
-    """Per-endpoint LLM calls to enrich each endpoint with business semantics."""
-    for ep in ctx.endpoints:
-        _enrich_one(ep, ctx)
+    """Per-endpoint LLM calls to enrich each endpoint with business semantics.
 
+    Calls are independent (each one only mutates its own endpoint), so they
+    run concurrently on one event loop, at most ``llm.MAX_CONCURRENT_CALLS`` at
+    a time.
+    """
+    asyncio.run(_enrich_all(ctx))
     return ctx.endpoints
 
 
-def _enrich_one(ep: EndpointSpec, ctx: EnrichmentContext) -> None:
-    summary = _build_endpoint_summary(ep, ctx.traces, ctx.correlations)
+async def _enrich_all(ctx: EnrichmentContext) -> None:
+    index = index_by_method(ctx.traces)
+    await llm.gather_bounded(_enrich_one(ep, ctx, index) for ep in ctx.endpoints)
+
+
+async def _enrich_one(
+    ep: EndpointSpec, ctx: EnrichmentContext, index: TraceIndex
+) -> None:
+    summary = _build_endpoint_summary(ep, index, ctx.correlations)
     summary_size = len(minified(summary))
     if summary_size > _MAX_SUMMARY_CHARS:
         est_tokens = summary_size // 4
@@ -50,7 +62,7 @@ def _enrich_one(ep: EndpointSpec, ctx: EnrichmentContext) -> None:
 
     try:
         conv = llm.Conversation(max_tokens=4096, label=f"enrich_{ep.id}")
-        result = conv.ask_json(prompt, EndpointEnrichmentResponse)
+        result = await conv.ask_json_async(prompt, EndpointEnrichmentResponse)
         _apply_enrichment(ep, result)
     except Exception as exc:
         console.print(
@@ -59,10 +71,9 @@ def _enrich_one(ep: EndpointSpec, ctx: EnrichmentContext) -> None:
         )
 
 
-
 def _build_endpoint_summary(
     ep: EndpointSpec,
-    all_traces: list[Trace],
+    index: TraceIndex,
     correlations: list[Correlation],
 ) -> dict[str, Any]:
     """Build a compact summary of one endpoint for the LLM prompt."""
@@ -72,12 +83,14 @@ def _build_endpoint_summary(
         path=ep.path,
     )
 
-    ep_traces = _match_traces_by_pattern(ep.method, ep.path, all_traces)
+    ep_traces = match_traces_by_pattern(ep.method, ep.path, index)
+    # Identity set: list membership would compare whole traces field by field.
+    ep_trace_ids = {id(t) for t in ep_traces}
 
     ui_triggers: list[dict[str, str]] = []
     for corr in correlations:
         for t in corr.traces:
-            if t in ep_traces:
+            if id(t) in ep_trace_ids:
                 ui_triggers.append(
                     {
                         "action": corr.context.meta.action,
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import codecs
 from collections import defaultdict
 from collections.abc import Callable
 import json
 import re
 from typing import Any, cast
-from urllib.parse import urlparse
 
 from cli.commands.capture.types import Trace
 from cli.commands.openapi.analyze.types import (
@@ -16,14 +16,18 @@ from cli.commands.openapi.analyze.types import (
     RequestSpec,
     ResponseSpec,
 )
-from cli.helpers.http import get_header
+from cli.helpers.http import get_header, url_path
 from cli.helpers.schema import analyze_schema, infer_path_schema, infer_query_schema
 
+_PLACEHOLDER_RE = re.compile(r"\{[^}]+\}")
+_NON_IDENT_RE = re.compile(r"[^a-zA-Z0-9_]")
+_JSON_WS = b" \t\r\n"
+
 
 def _pattern_to_regex(pattern: str) -> re.Pattern[str]:
     """Convert a path pattern like /api/users/{user_id}/orders to a regex."""
-    parts = re.split(r"\{[^}]+\}", pattern)
-    placeholders = re.findall(r"\{[^}]+\}", pattern)
+    parts = _PLACEHOLDER_RE.split(pattern)
+    placeholders = _PLACEHOLDER_RE.findall(pattern)
 
     regex = ""
     for i, part in enumerate(parts):
@@ -38,57 +42,88 @@ def mechanical_extraction(
     groups: list[EndpointGroup], traces: list[Trace]
 ) -> list[EndpointSpec]:
     """Build EndpointSpec for each group using only mechanical extraction."""
+    index = index_by_method(traces)
     endpoints: list[EndpointSpec] = []
     for group in groups:
-        group_traces = find_traces_for_group(group, traces)
+        group_traces = _find_traces_for_group(group, index)
         endpoint = _build_endpoint_mechanical(
             group.method, group.pattern, group_traces,
         )
+        endpoint.rate_limit = extract_rate_limit(group_traces)
         endpoints.append(endpoint)
     return endpoints
 
 
-def _match_traces_by_pattern(
-    method: str, path_pattern: str, traces: list[Trace]
+TraceIndex = dict[str, list[tuple[Trace, str]]]
+"""Traces bucketed by upper-cased method, each paired with its URL path."""
+
+
+def index_by_method(traces: list[Trace]) -> TraceIndex:
+    """Bucket *traces* by method so lookups never re-parse URLs.
+
+    Build it once and reuse it for every pattern matched against the same
+    traces.
+    """
+    index: TraceIndex = defaultdict(list)
+    for t in traces:
+        req = t.meta.request
+        index[req.method.upper()].append((t, url_path(req.url)))
+    return index
+
+
+def match_traces_by_pattern(
+    method: str, path_pattern: str, index: TraceIndex
 ) -> list[Trace]:
-    """Return traces whose method and URL path match *path_pattern*."""
+    """Return indexed traces whose method and URL path match *path_pattern*."""
     pattern_re = _pattern_to_regex(path_pattern)
-    return [
-        t
-        for t in traces
-        if t.meta.request.method.upper() == method
-        and pattern_re.match(urlparse(t.meta.request.url).path)
-    ]
+    return [t for t, path in index.get(method, []) if pattern_re.match(path)]
 
 
-def find_traces_for_group(group: EndpointGroup, traces: list[Trace]) -> list[Trace]:
-    """Find traces whose URLs are listed in the endpoint group."""
+def _find_traces_for_group(group: EndpointGroup, index: TraceIndex) -> list[Trace]:
+    """Listed URLs first, then pattern matches, each in capture order."""
+    candidates = index.get(group.method, [])
     url_set = set(group.urls)
-    matched = [
-        t
-        for t in traces
-        if t.meta.request.url in url_set
-        and t.meta.request.method.upper() == group.method
-    ]
+    matched = [t for t, _ in candidates if t.meta.request.url in url_set]
 
     matched_set = set(id(t) for t in matched)
-    for t in _match_traces_by_pattern(group.method, group.pattern, traces):
-        if id(t) not in matched_set:
+    pattern_re = _pattern_to_regex(group.pattern)
+    for t, path in candidates:
+        if id(t) not in matched_set and pattern_re.match(path):
             matched.append(t)
             matched_set.add(id(t))
 
     return matched
 
 
+def _may_be_json_object(body: bytes) -> bool:
+    """Cheap probe: can *body* decode to a JSON object?
+
+    Only the first bytes are inspected, so HTML, images, JSON arrays and
+    scalars are rejected without paying for a full parse.
+    """
+    head = body[:64].lstrip(_JSON_WS)
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8):].lstrip(_JSON_WS)
+    # An all-whitespace prefix is inconclusive; let the parser decide.
+    return not head or head[:1] == b"{"
+
+
 def _collect_json_bodies(
     traces: list[Trace], get_body: Callable[[Trace], bytes]
 ) -> list[dict[str, Any]]:
-    """Parse JSON bodies from *traces*, returning only ``dict`` results."""
+    """Parse JSON bodies from *traces*, returning only ``dict`` results.
+
+    Byte-identical bodies (polling, retries) are parsed once: a repeat adds
+    no new value to the schema, and hashing the bytes is far cheaper than
+    parsing and re-walking them.
+    """
     results: list[dict[str, Any]] = []
+    seen: set[bytes] = set()
     for t in traces:
         body = get_body(t)
-        if not body:
+        if not body or body in seen or not _may_be_json_object(body):
             continue
+        seen.add(body)
         try:
             data: Any = json.loads(body)
             if isinstance(data, dict):
@@ -121,7 +156,7 @@ def _build_endpoint_mechanical(
 def _make_endpoint_id(method: str, path: str) -> str:
     """Generate a readable endpoint ID from method and path."""
     clean = path.strip("/").replace("/", "_").replace("{", "").replace("}", "")
-    clean = re.sub(r"[^a-zA-Z0-9_]", "_", clean)
+    clean = _NON_IDENT_RE.sub("_", clean)
     return f"{method.lower()}_{clean}" if clean else method.lower()
 
 
@@ -130,11 +165,14 @@ def _build_request_spec(traces: list[Trace], path_pattern: str) -> RequestSpec:
     path_schema = infer_path_schema(traces, path_pattern)
     query_schema = infer_query_schema(traces)
 
+    # Last observed request content-type wins; scan from the end and stop at
+    # the first hit instead of reading the header on every trace.
     content_type = None
-    for trace in traces:
+    for trace in reversed(traces):
         ct = get_header(trace.meta.request.headers, "content-type")
         if ct:
             content_type = ct
+            break
 
     body_samples = _collect_json_bodies(traces, lambda t: t.request_body)
     body_schema = analyze_schema(body_samples) if body_samples else None
@@ -157,16 +195,29 @@ def _build_response_specs(traces: list[Trace]) -> list[ResponseSpec]:
     for status, status_traces in sorted(by_status.items()):
         ct = get_header(status_traces[0].meta.response.headers, "content-type")
 
+        # Parse each body once: the first parseable one is the example, and
+        # every object body feeds the schema.
         schema: dict[str, Any] | None = None
         example_body: Any = None
+        body_samples: list[dict[str, Any]] = []
+        seen: set[bytes] = set()
         for t in status_traces:
-            if t.response_body and example_body is None:
-                try:
-                    example_body = json.loads(t.response_body)
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    pass
+            body = t.response_body
+            # Byte-identical repeats add nothing to the example or schema.
+            if not body or body in seen:
+                continue
+            seen.add(body)
+            if example_body is not None and not _may_be_json_object(body):
+                continue
+            try:
+                data: Any = json.loads(body)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if example_body is None:
+                example_body = data
+            if isinstance(data, dict):
+                body_samples.append(cast(dict[str, Any], data))
 
-        body_samples = _collect_json_bodies(status_traces, lambda t: t.response_body)
         if body_samples:
             schema = analyze_schema(body_samples)
 
@@ -182,15 +233,17 @@ def _build_response_specs(traces: list[Trace]) -> list[ResponseSpec]:
     return specs
 
 
-_RATE_LIMIT_HEADERS = [
-    "x-ratelimit-limit",
-    "x-ratelimit-remaining",
-    "x-ratelimit-reset",
-    "ratelimit-limit",
-    "ratelimit-remaining",
-    "ratelimit-reset",
-    "retry-after",
-]
+_RATE_LIMIT_HEADERS: frozenset[str] = frozenset(
+    {
+        "x-ratelimit-limit",
+        "x-ratelimit-remaining",
+        "x-ratelimit-reset",
+        "ratelimit-limit",
+        "ratelimit-remaining",
+        "ratelimit-reset",
+        "retry-after",
+    }
+)
 
 
 def extract_rate_limit(traces: list[Trace]) -> str | None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+
 from cli.commands.openapi.analyze.types import EndpointGroup, EndpointGroupListResponse
 from cli.helpers.detect_base_url import MethodUrlPair
 from cli.helpers.http import compact_url
@@ -11,15 +13,10 @@ from cli.helpers.prompt import render
 
 def group_endpoints(pairs: list[MethodUrlPair]) -> list[EndpointGroup]:
     """Ask the LLM to group URLs into endpoint patterns with {param} syntax."""
-    unique_pairs = sorted(set(pairs))
-    compacted_pairs = sorted(
-        set(MethodUrlPair(p.method, compact_url(p.url)) for p in unique_pairs)
-    )
-
-    compact_to_originals: dict[MethodUrlPair, list[str]] = {}
-    for p in unique_pairs:
-        key = MethodUrlPair(p.method, compact_url(p.url))
-        compact_to_originals.setdefault(key, []).append(p.url)
+    compact_to_originals: dict[MethodUrlPair, list[str]] = defaultdict(list)
+    for p in sorted(set(pairs)):
+        compact_to_originals[MethodUrlPair(p.method, compact_url(p.url))].append(p.url)
+    compacted_pairs = sorted(compact_to_originals)
 
     prompt = render("openapi-group-endpoints.j2", pairs=compacted_pairs)
 
@@ -38,7 +38,7 @@ class EndpointEnrichmentResponse(BaseModel):
     discovery_notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestSpec:
     content_type: str | None = None
     path_schema: dict[str, Any] | None = None
@@ -46,7 +46,7 @@ class RequestSpec:
     body_schema: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseSpec:
     status: int = 0
     content_type: str | None = None
@@ -58,7 +58,7 @@ class ResponseSpec:
     resolution: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointSpec:
     id: str = ""
     path: str = ""
@@ -16,6 +16,9 @@ from cli.helpers.detect_base_url import detect_base_urls
 import cli.helpers.llm as llm
 from cli.helpers.storage import list_captures, load_app_bundle
 
+# libyaml's C emitter when PyYAML was built with it, pure-Python otherwise.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @click.command()
 @click.argument("app_name")
@@ -28,13 +31,21 @@ from cli.helpers.storage import list_captures, load_app_bundle
 @click.option(
     "--debug", is_flag=True, default=False, help="Save LLM prompts/responses to debug/"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Call the LLM instead of replaying cached responses (refreshes the cache).",
+)
 @click.option(
     "--skip-enrich",
     is_flag=True,
     default=False,
     help="Skip LLM enrichment step (business context, glossary, etc.)",
 )
-def analyze(app_name: str, output: str, debug: bool, skip_enrich: bool) -> None:
+def analyze(
+    app_name: str, output: str, debug: bool, no_cache: bool, skip_enrich: bool
+) -> None:
     """Analyze captures for an app and produce an OpenAPI spec."""
     cap_count = len(list_captures(app_name))
     console.print(f"[bold]Loading captures for app:[/bold] {app_name}")
@@ -47,6 +58,7 @@ def analyze(app_name: str, output: str, debug: bool, skip_enrich: bool) -> None:
     )
 
     llm.init_debug(debug=debug)
+    llm.init_cache(refresh=no_cache)
 
     console.print(
         f"[bold]Analyzing with LLM ({llm.current_model()})...[/bold]"
@@ -58,10 +70,13 @@ def analyze(app_name: str, output: str, debug: bool, skip_enrich: bool) -> None:
     out_path = output_base.with_suffix(".yaml")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(out_path, "w") as f:
+    # The emitter writes one small chunk per token; a large buffer turns
+    # that into a handful of write syscalls for multi-MB specs.
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
         yaml.dump(
             openapi_dict,
             f,
+            Dumper=_YAML_DUMPER,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
@@ -89,7 +104,8 @@ def _run_openapi(
         f"  Kept {len(rest_traces)}/{len(bundle.traces)} traces under {base_url}"
     )
 
-    correlations = correlate(bundle)
+    # Only enrichment reads the correlations.
+    correlations = [] if skip_enrich else correlate(bundle)
 
     openapi_dict = rest_analyze(
         rest_traces,
@@ -70,7 +70,7 @@ _spectral() {
                 return
             fi
             case "$cmd2" in
-                analyze) [[ "$cur" == -* ]] && COMPREPLY=($(compgen -W "-o --output --debug --skip-enrich --help" -- "$cur")) || _spectral_apps ;;
+                analyze) [[ "$cur" == -* ]] && COMPREPLY=($(compgen -W "-o --output --debug --no-cache --skip-enrich --help" -- "$cur")) || _spectral_apps ;;
             esac ;;
         graphql)
             if [[ $cword -eq 2 ]]; then
@@ -78,7 +78,7 @@ _spectral() {
                 return
             fi
             case "$cmd2" in
-                analyze) [[ "$cur" == -* ]] && COMPREPLY=($(compgen -W "-o --output --debug --skip-enrich --help" -- "$cur")) || _spectral_apps ;;
+                analyze) [[ "$cur" == -* ]] && COMPREPLY=($(compgen -W "-o --output --debug --no-cache --skip-enrich --help" -- "$cur")) || _spectral_apps ;;
             esac ;;
         extension)
             if [[ $cword -eq 2 ]]; then
@@ -7,6 +7,8 @@ from typing import Any, cast
 
 from pydantic import BaseModel, Field, model_validator
 
+_URL_PARAM_RE = re.compile(r"\{(\w+)\}")
+
 
 class ToolRequest(BaseModel):
     """HTTP request template for an MCP tool."""
@@ -32,7 +34,7 @@ class ToolDefinition(BaseModel):
     @model_validator(mode="after")
     def validate_param_refs(self) -> ToolDefinition:
         """Ensure every {param} and $param reference matches a declared parameter."""
-        url_params = set(re.findall(r"\{(\w+)\}", self.request.url))
+        url_params = set(_URL_PARAM_RE.findall(self.request.url))
         properties = set(self.parameters.get("properties", {}).keys())
 
         missing_url = url_params - properties
@@ -4,6 +4,7 @@ from cli.helpers.auth._errors import AuthScriptInvalid
 from cli.helpers.prompt import render
 
 _NO_AUTH_SENTINEL = "NO_AUTH"
+_PYTHON_FENCE_RE = re.compile(r"```python\s*\n(.*?)```", re.DOTALL)
 
 
 def get_auth_instructions() -> str:
@@ -21,7 +22,7 @@ def extract_script(text: str) -> str | None:
         return None
 
     # Strip markdown fences if present
-    match = re.search(r"```python\s*\n(.*?)```", text, re.DOTALL)
+    match = _PYTHON_FENCE_RE.search(text)
     script = match.group(1).strip() + "\n" if match else text.strip() + "\n"
 
     # Compile and exec to check exports
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 
 from cli.commands.capture.types import CaptureBundle, Context, Trace, WsMessage
@@ -31,6 +32,8 @@ def correlate(
     for ws_conn in bundle.ws_connections:
         all_ws_messages.extend(ws_conn.messages)
     all_ws_messages.sort(key=lambda m: m.meta.timestamp)
+    trace_ts = [t.meta.timestamp for t in sorted_traces]
+    ws_ts = [m.meta.timestamp for m in all_ws_messages]
 
     correlations: list[Correlation] = []
 
@@ -41,11 +44,12 @@ def correlate(
             next_ctx_ts = sorted_contexts[i + 1].meta.timestamp
             end_ts = min(end_ts, next_ctx_ts)
 
-        matched_traces = [
-            t for t in sorted_traces if start_ts <= t.meta.timestamp < end_ts
+        # Both lists are sorted, so the window is a contiguous slice.
+        matched_traces = sorted_traces[
+            bisect_left(trace_ts, start_ts) : bisect_left(trace_ts, end_ts)
         ]
-        matched_ws = [
-            m for m in all_ws_messages if start_ts <= m.meta.timestamp < end_ts
+        matched_ws = all_ws_messages[
+            bisect_left(ws_ts, start_ts) : bisect_left(ws_ts, end_ts)
         ]
 
         correlations.append(
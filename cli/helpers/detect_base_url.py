@@ -46,10 +46,14 @@ def detect_base_urls(bundle: CaptureBundle, app_name: str) -> list[str]:
     if cached is not None:
         return cached
 
-    counts = Counter(
-        (t.meta.request.method.upper(), compact_url(t.meta.request.url))
-        for t in bundle.traces
+    # Count raw URLs first so compact_url (urlparse + base64 probing) runs
+    # once per distinct URL rather than once per trace.
+    raw_counts = Counter(
+        (t.meta.request.method.upper(), t.meta.request.url) for t in bundle.traces
     )
+    counts: Counter[tuple[str, str]] = Counter()
+    for (method, url), n in raw_counts.items():
+        counts[(method, compact_url(url))] += n
 
     prompt = render("detect-base-urls.j2", counts=counts)
 
@@ -43,6 +43,26 @@ def sanitize_headers(headers: dict[str, str]) -> dict[str, str]:
     return {k: v for k, v in headers.items() if k.lower() not in _NOISE_HEADERS}
 
 
+def url_path(url: str) -> str:
+    """Return the path of *url*, same as ``urlparse(url).path``.
+
+    Captured URLs are almost always plain ``scheme://host/path?query``;
+    those are sliced directly instead of building a ``ParseResult``.
+    Anything else (``;params``, control characters, relative or odd
+    schemes) is delegated to ``urlparse``.
+    """
+    sep = url.find("://")
+    if sep > 0 and url[:sep].isalpha() and ";" not in url and url.isprintable():
+        end = len(url)
+        for ch in "?#":
+            i = url.find(ch, sep + 3, end)
+            if i >= 0:
+                end = i
+        start = url.find("/", sep + 3, end)
+        return url[start:end] if start >= 0 else ""
+    return urlparse(url).path
+
+
 def compact_url(url: str) -> str:
     """Strip query string and replace long base64-encoded path segments with a placeholder.
 
@@ -5,6 +5,7 @@ Usage::
     import cli.helpers.llm as llm
 
     llm.init_debug(debug=True)
+    llm.init_cache()  # replay identical requests from <store>/llm-cache
 
     conv = llm.Conversation(system="...", label="my_task")
     text = conv.ask_text(prompt)
@@ -16,15 +17,23 @@ For tests, import setup helpers directly from submodules::
 
 from __future__ import annotations
 
+from cli.helpers.llm._cache import init_cache
 from cli.helpers.llm._client import create_config_interactive, current_model
-from cli.helpers.llm._conversation import Conversation
+from cli.helpers.llm._conversation import (
+    MAX_CONCURRENT_CALLS,
+    Conversation,
+    gather_bounded,
+)
 from cli.helpers.llm._cost import print_usage_summary
 from cli.helpers.llm._debug import init_debug
 
 __all__ = [
+    "MAX_CONCURRENT_CALLS",
     "Conversation",
     "create_config_interactive",
     "current_model",
+    "gather_bounded",
+    "init_cache",
     "init_debug",
     "print_usage_summary",
 ]
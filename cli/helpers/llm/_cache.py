@@ -0,0 +1,82 @@
+"""On-disk cache of LLM responses, keyed by a hash of the full request."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from cli.helpers.storage import store_root
+
+_cache_dir: Path | None = None
+_refresh = False
+
+
+def init_cache(
+    *, cache: bool = True, refresh: bool = False, cache_dir: Path | None = None
+) -> None:
+    """Configure response caching under *cache_dir* (default ``<store>/llm-cache``).
+
+    With *refresh*, lookups always miss but fresh responses are still stored,
+    overwriting any stale entry.  Delete the directory to clear the cache.
+    """
+    global _cache_dir, _refresh
+    if cache and cache_dir is None:
+        cache_dir = store_root() / "llm-cache"
+    _cache_dir = cache_dir if cache else None
+    _refresh = refresh
+
+
+def clear_cache_dir() -> None:
+    """Disable the response cache (for tests)."""
+    global _cache_dir, _refresh
+    _cache_dir = None
+    _refresh = False
+
+
+def is_enabled() -> bool:
+    """Return whether ``init_cache`` turned caching on."""
+    return _cache_dir is not None
+
+
+def make_key(parts: list[str]) -> str:
+    """Hash every input that can change the response into a cache key."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load(key: str) -> dict[str, Any] | None:
+    """Return the cached entry for *key*, or ``None`` on a miss or refresh."""
+    if _cache_dir is None or _refresh:
+        return None
+    path = _cache_dir / f"{key}.json"
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def store(key: str, entry: dict[str, Any]) -> None:
+    """Persist *entry* under *key*. Write failures are ignored.
+
+    The entry is written to a temporary file and renamed into place, so an
+    interrupted run never leaves a truncated entry behind.
+    """
+    if _cache_dir is None:
+        return
+    tmp_path: str | None = None
+    try:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_cache_dir, prefix=f".{key}.", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _cache_dir / f"{key}.json")
+    except OSError:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
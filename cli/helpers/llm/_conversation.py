@@ -3,25 +3,32 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Sequence
+from collections.abc import Awaitable, Iterable, Sequence
+import json
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
 from cli.commands.capture.types import CaptureBundle
+import cli.helpers.llm._cache as _cache
 from cli.helpers.llm._client import get_or_create_config
-from cli.helpers.llm._cost import record_usage
+from cli.helpers.llm._cost import record_cached_call, record_usage
 from cli.helpers.llm._debug import DebugSession
-from cli.helpers.llm.tools import ToolDeps, describe_tools, make_tools
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# Upper bound on LLM requests in flight at once from ``gather_bounded``.
+MAX_CONCURRENT_CALLS = 8
 
 
 class Conversation:
     """A multi-turn conversation with the LLM.
 
     Config (system, tools, etc.) is fixed at construction.
-    ``ask_text`` and ``ask_json`` are the two public methods.
+    ``ask_text`` and ``ask_json`` are the two public methods; their
+    ``_async`` variants let callers run several conversations concurrently
+    on one event loop.
     """
 
     def __init__(
@@ -34,6 +41,9 @@ class Conversation:
         max_iterations: int = 10,
         label: str = "",
     ) -> None:
+        # The tool registry imports pydantic_ai; keep it off the CLI startup path.
+        from cli.helpers.llm.tools import ToolDeps, describe_tools, make_tools
+
         self._system = self._join_system(system)
         self._max_tokens = max_tokens
         self._max_iterations = max_iterations
@@ -42,6 +52,7 @@ class Conversation:
 
         self._config = get_or_create_config()
 
+        self._tool_names = list(tool_names) if tool_names is not None else []
         if tool_names is not None:
             self._tools = make_tools(tool_names)
             self._dbg.record_tools(describe_tools(tool_names))
@@ -67,6 +78,14 @@ class Conversation:
         """
         return self._run(prompt, output_type=response_model)
 
+    async def ask_text_async(self, prompt: str) -> str:
+        """Async variant of ``ask_text``, for use inside a running event loop."""
+        return await self._run_async(prompt, output_type=str)
+
+    async def ask_json_async(self, prompt: str, response_model: type[T]) -> T:
+        """Async variant of ``ask_json``, for use inside a running event loop."""
+        return await self._run_async(prompt, output_type=response_model)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -78,9 +97,24 @@ class Conversation:
     async def _run_async(self, prompt: str, *, output_type: Any) -> Any:
         """Run the agent and record results."""
         from pydantic_ai import Agent
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
         from pydantic_ai.usage import UsageLimits
 
         from cli.helpers.llm.providers import build_model
+        from cli.helpers.llm.tools import ToolDeps
+
+        cache_key = self._cache_key(prompt, output_type)
+        if cache_key is not None:
+            entry = _cache.load(cache_key)
+            if entry is not None:
+                prev_len = len(self._messages)
+                self._messages = ModelMessagesTypeAdapter.validate_python(entry["messages"])
+                self._dbg.record_cache_hit()
+                self._dbg.record_messages(self._messages, prev_len)
+                record_cached_call(self._label)
+                if output_type is str:
+                    return entry["output"]
+                return output_type.model_validate(entry["output"])
 
         model, settings = build_model(
             self._config.provider,
@@ -122,8 +156,41 @@ class Conversation:
         self._messages = result.all_messages()
         record_usage(result.usage(), self._label)
 
+        if cache_key is not None:
+            output = result.output
+            _cache.store(cache_key, {
+                "output": output if isinstance(output, str) else output.model_dump(mode="json"),
+                "messages": ModelMessagesTypeAdapter.dump_python(self._messages, mode="json"),
+            })
+
         return result.output
 
+    def _cache_key(self, prompt: str, output_type: Any) -> str | None:
+        """Key identifying this exact request, or ``None`` when not cacheable.
+
+        Conversations bound to a bundle are never cached: their tools answer
+        from captured traffic that is not part of the prompt.
+        """
+        if not _cache.is_enabled() or self._deps.traces or self._deps.contexts:
+            return None
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        schema = (
+            "str" if output_type is str
+            else json.dumps(output_type.model_json_schema(), sort_keys=True)
+        )
+        history = ModelMessagesTypeAdapter.dump_json(self._messages).decode()
+        return _cache.make_key([
+            self._config.provider,
+            self._config.model,
+            str(self._max_tokens),
+            self._system or "",
+            ",".join(self._tool_names),
+            schema,
+            history,
+            prompt,
+        ])
+
     @staticmethod
     def _join_system(system: str | list[str] | None) -> str | None:
         """Collapse system prompts into a single string."""
@@ -132,3 +199,19 @@ class Conversation:
         if isinstance(system, str):
             return system
         return "\n\n".join(system)
+
+
+async def gather_bounded(
+    calls: Iterable[Awaitable[R]], limit: int = MAX_CONCURRENT_CALLS
+) -> list[R]:
+    """Await *calls* concurrently, at most *limit* at a time.
+
+    Results come back in input order, like ``asyncio.gather``.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(call: Awaitable[R]) -> R:
+        async with semaphore:
+            return await call
+
+    return await asyncio.gather(*(run(c) for c in calls))
@@ -11,6 +11,7 @@ _total_output_tokens: int = 0
 _total_cache_read_tokens: int = 0
 _total_cache_creation_tokens: int = 0
 _total_cost: float = 0.0
+_cached_calls: int = 0
 
 
 def record_usage(usage: Any, label: str) -> None:
@@ -50,25 +51,38 @@ def record_usage(usage: Any, label: str) -> None:
         console.print(line)
 
 
+def record_cached_call(label: str) -> None:
+    """Count a call answered from the response cache and print a dim line."""
+    global _cached_calls
+    _cached_calls += 1
+    if label:
+        console.print(f"  [dim]{label:<30} cached · 0 tokens[/dim]")
+
+
 def reset_usage() -> None:
     """Reset all token counters to zero."""
     global _total_input_tokens, _total_output_tokens
     global _total_cache_read_tokens, _total_cache_creation_tokens, _total_cost
+    global _cached_calls
     _total_input_tokens = 0
     _total_output_tokens = 0
     _total_cache_read_tokens = 0
     _total_cache_creation_tokens = 0
     _total_cost = 0.0
+    _cached_calls = 0
 
 
 def print_usage_summary() -> None:
     """Print a formatted usage summary line."""
-    if not (_total_input_tokens or _total_output_tokens):
+    if not (_total_input_tokens or _total_output_tokens or _cached_calls):
         return
     cost_str = f" (~${_total_cost:.2f})" if _total_cost else ""
+    cached_str = (
+        f"; {_cached_calls:,} call(s) replayed from cache" if _cached_calls else ""
+    )
     console.print(
         f"  LLM token usage: {_total_input_tokens:,} input, "
-        f"{_total_output_tokens:,} output{cost_str}"
+        f"{_total_output_tokens:,} output{cost_str}{cached_str}"
     )
 
 
@@ -13,6 +13,11 @@ from cli.helpers.json import reformat_json_lines
 _debug_dir: Path | None = None
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as ``2026-01-31T12:34:56.789Z``."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
 def _format_args(args: str | dict[str, Any] | None) -> str:
     """Normalize tool call args to a JSON string."""
     if args is None:
@@ -37,8 +42,7 @@ def init_debug(*, debug: bool = False, debug_dir: Path | None = None) -> None:
     """Configure debug logging. Auto-creates a timestamped dir when debug=True."""
     global _debug_dir
     if debug and debug_dir is None:
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-        debug_dir = Path("debug") / ts
+        debug_dir = Path("debug") / _utc_timestamp()
         debug_dir.mkdir(parents=True, exist_ok=True)
         console.print(f"  Debug logs → {debug_dir}")
     _debug_dir = debug_dir
@@ -58,8 +62,7 @@ class DebugSession:
         if _debug_dir is None:
             self._path: Path | None = None
         else:
-            ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-            self._path = _debug_dir / f"{ts}_{call_name}"
+            self._path = _debug_dir / f"{_utc_timestamp()}_{call_name}"
 
     def record_tools(self, tools: dict[str, str]) -> None:
         """Write a tools summary header at the top of the debug file."""
@@ -68,6 +71,12 @@ class DebugSession:
         lines = [f"  - {name}: {desc}" for name, desc in tools.items()]
         self._append("=== TOOLS ===\n" + "\n".join(lines) + "\n\n")
 
+    def record_cache_hit(self) -> None:
+        """Mark the messages that follow as replayed from the response cache."""
+        if self._path is None:
+            return
+        self._append("=== CACHED (replayed, no model call) ===\n")
+
     def record_messages(self, messages: list[Any], prev_len: int) -> None:
         """Record new messages from a PydanticAI run."""
         if self._path is None:
@@ -5,6 +5,9 @@ from __future__ import annotations
 import base64
 import re
 
+_URLSAFE_B64_RE = re.compile(r"[A-Za-z0-9\-_=]+")
+_STD_B64_RE = re.compile(r"[A-Za-z0-9+/=]+")
+
 
 def decode_base64(value: str) -> str:
     """Decode a base64-encoded string (standard or URL-safe, auto-padding).
@@ -16,12 +19,12 @@ def decode_base64(value: str) -> str:
     """
     padded = value + "=" * (-len(value) % 4)
     raw = None
-    if re.fullmatch(r"[A-Za-z0-9\-_=]+", padded):
+    if _URLSAFE_B64_RE.fullmatch(padded):
         try:
             raw = base64.urlsafe_b64decode(padded)
         except Exception:
             pass
-    if raw is None and re.fullmatch(r"[A-Za-z0-9+/=]+", padded):
+    if raw is None and _STD_B64_RE.fullmatch(padded):
         try:
             raw = base64.b64decode(padded, validate=True)
         except Exception:
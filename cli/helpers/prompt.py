@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.resources
 import json
+import re
 import traceback as _tb
 from typing import Any
 
@@ -49,14 +50,18 @@ _AUTH_KEYWORDS: frozenset[str] = frozenset(
 )
 
 
+# One case-insensitive scan of the raw URL instead of lower() + a scan per keyword.
+_AUTH_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_AUTH_KEYWORDS)), re.IGNORECASE
+)
+
+
 def _is_auth_trace(trace: Any) -> bool:
     """Return True if *trace* looks auth-related."""
-    url_lower: str = trace.meta.request.url.lower()
-    req_headers = {h.name.lower() for h in trace.meta.request.headers}
     return (
-        "authorization" in req_headers
-        or any(kw in url_lower for kw in _AUTH_KEYWORDS)
-        or trace.meta.response.status in (401, 403)
+        trace.meta.response.status in (401, 403)
+        or _AUTH_KEYWORD_RE.search(trace.meta.request.url) is not None
+        or any(h.name.lower() == "authorization" for h in trace.meta.request.headers)
     )
 
 
@@ -2,36 +2,53 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 from typing import Any
-from urllib.parse import urlparse
 
 from cli.commands.capture.types import Trace
+from cli.helpers.http import url_path
 from cli.helpers.schema._scalars import coerce_value
 from cli.helpers.schema._schema_inference import infer_schema
 
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
 
-def _extract_path_param_values(
-    traces: list[Trace],
+
+@lru_cache(maxsize=512)
+def _compile_path_pattern(
     path_pattern: str,
-    param_names: list[str],
-) -> dict[str, list[str]]:
-    """Extract observed path parameter values from trace URLs.
+) -> tuple[re.Pattern[str] | None, tuple[str, ...]]:
+    """Compile *path_pattern* into a regex with one named group per parameter.
 
-    Builds a named-group regex from the pattern and matches each trace URL
-    to collect distinct values per parameter.
+    Returns the regex and the parameter names, or ``(None, ())`` when the
+    pattern has no ``{param}`` segments.  Cached, so each distinct pattern
+    is parsed and compiled once.
     """
+    param_names = tuple(_PATH_PARAM_RE.findall(path_pattern))
+    if not param_names:
+        return None, ()
     regex = path_pattern
     for name in param_names:
         regex = regex.replace(f"{{{name}}}", f"(?P<{name}>[^/]+)")
-    regex = regex + "$"
-    compiled = re.compile(regex)
+    return re.compile(regex + "$"), param_names
 
+
+def _extract_path_param_values(
+    traces: list[Trace],
+    compiled: re.Pattern[str],
+    param_names: tuple[str, ...],
+) -> dict[str, list[str]]:
+    """Extract observed path parameter values from trace URLs.
+
+    Matches each trace URL path against the named-group regex from
+    ``_compile_path_pattern`` to collect distinct values per parameter.
+    """
     result: dict[str, list[str]] = {name: [] for name in param_names}
     seen: dict[str, set[str]] = {name: set() for name in param_names}
+    # Bind the regex method once instead of once per trace.
+    search = compiled.search
     for t in traces:
-        parsed = urlparse(t.meta.request.url)
-        m = compiled.search(parsed.path)
+        m = search(url_path(t.meta.request.url))
         if m:
             for name in param_names:
                 val = m.group(name)
@@ -75,11 +92,14 @@ def infer_path_schema(traces: list[Trace], path_pattern: str) -> dict[str, Any]
 
     Returns ``None`` when the pattern contains no ``{param}`` segments.
     """
-    param_names = re.findall(r"\{(\w+)\}", path_pattern)
-    if not param_names:
+    # Most endpoints have no placeholders; a substring test settles those.
+    if "{" not in path_pattern:
+        return None
+    compiled, param_names = _compile_path_pattern(path_pattern)
+    if compiled is None:
         return None
 
-    observed = _extract_path_param_values(traces, path_pattern, param_names)
+    observed = _extract_path_param_values(traces, compiled, param_names)
     samples = _build_samples(observed)
     schema = (
         infer_schema(samples)
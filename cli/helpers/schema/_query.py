@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus, urlsplit
 
 from cli.commands.capture.types import Trace
 from cli.helpers.schema._scalars import coerce_value
 from cli.helpers.schema._schema_inference import infer_schema
 
 
+def _first_query_values(query: str) -> dict[str, str]:
+    """Map each parameter in *query* to its first non-blank decoded value.
+
+    Same result as taking ``values[0]`` from ``parse_qs(query)``, without
+    building the per-key value lists or decoding values of repeated keys.
+    """
+    result: dict[str, str] = {}
+    for pair in query.split("&"):
+        key, sep, value = pair.partition("=")
+        # parse_qs drops pairs without "=" and pairs with a blank value.
+        if not sep or not value:
+            continue
+        key = unquote_plus(key)
+        if key not in result:
+            result[key] = unquote_plus(value)
+    return result
+
+
 def infer_query_schema(traces: list[Trace]) -> dict[str, Any] | None:
     """Infer an annotated JSON schema for query string parameters.
 
@@ -20,27 +37,17 @@ def infer_query_schema(traces: list[Trace]) -> dict[str, Any] | None:
 
     Returns ``None`` when no query parameters are found.
     """
-    # Collect raw string values per query parameter across all traces.
-    raw_params: dict[str, list[str]] = defaultdict(list)
-    for trace in traces:
-        parsed = urlparse(trace.meta.request.url)
-        qs = parse_qs(parsed.query)
-        for key, values in qs.items():
-            raw_params[key].extend(values)
-
-    if not raw_params:
-        return None
-
-    # Build one sample dict per trace, coercing string values to Python types.
+    # One sample dict per trace with a query string, coercing each
+    # parameter's first value to its Python type.  URLs without "?" are
+    # skipped before any parsing.
     samples: list[dict[str, Any]] = []
     for trace in traces:
-        parsed = urlparse(trace.meta.request.url)
-        qs = parse_qs(parsed.query)
+        url = trace.meta.request.url
+        if "?" not in url:
+            continue
+        qs = _first_query_values(urlsplit(url).query)
         if qs:
-            sample: dict[str, Any] = {}
-            for key, values in qs.items():
-                sample[key] = coerce_value(values[0])
-            samples.append(sample)
+            samples.append({key: coerce_value(value) for key, value in qs.items()})
 
     if not samples:
         return None
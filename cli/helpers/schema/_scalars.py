@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
+_DIGIT_RE = re.compile(r"\d")
+_FLOAT_WORDS = frozenset({"nan", "inf", "infinity"})
+
 
 def coerce_value(s: str) -> Any:
     """Convert a string value to its natural Python type."""
     if s.isdigit():
         return int(s)
+    # Booleans are never valid floats, so test them first: one lower() and
+    # no ValueError raised for every "true"/"false".
+    lower = s.lower()
+    if lower in ("true", "false"):
+        return lower == "true"
+    # Every float() literal has a digit or spells nan/inf; plain words skip
+    # the raise-and-catch below.
+    if _DIGIT_RE.search(s) is None and lower.strip().lstrip("+-") not in _FLOAT_WORDS:
+        return s
     try:
         return float(s)
     except ValueError:
-        pass
-    if s.lower() in ("true", "false"):
-        return s.lower() == "true"
-    return s
+        return s
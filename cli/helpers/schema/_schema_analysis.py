@@ -31,17 +31,22 @@ class MapDecisionListResponse(BaseModel):
 # Dynamic key pattern detection (regex-based, deterministic)
 # ---------------------------------------------------------------------------
 
-# (name, regex, min_keys) — high-confidence patterns (uuid, hex) need only 1 key;
-# ambiguous patterns (date, year, numeric) need 3 to avoid false positives.
-_DYNAMIC_KEY_PATTERNS: list[tuple[str, re.Pattern[str], int]] = [
-    ("date", re.compile(r"^\d{4}-\d{2}-\d{2}"), 3),
-    ("year-month", re.compile(r"^\d{4}-\d{2}$"), 3),
+# (name, regex, min_keys, (min_len, max_len)) — high-confidence patterns (uuid,
+# hex) need only 1 key; ambiguous patterns (date, year, numeric) need 3 to avoid
+# false positives.  The length bounds are implied by each regex and let
+# ``_classify_key_pattern`` rule a pattern out from the first key's length alone;
+# upper bounds allow one extra character because ``$`` also matches before a
+# trailing newline.
+_DYNAMIC_KEY_PATTERNS: list[tuple[str, re.Pattern[str], int, tuple[int, int | None]]] = [
+    ("date", re.compile(r"^\d{4}-\d{2}-\d{2}"), 3, (10, None)),
+    ("year-month", re.compile(r"^\d{4}-\d{2}$"), 3, (7, 8)),
     (
         "uuid",
         re.compile(
             r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I
         ),
         1,
+        (36, 37),
     ),
     (
         "prefixed-uuid",
@@ -49,19 +54,44 @@ _DYNAMIC_KEY_PATTERNS: list[tuple[str, re.Pattern[str], int]] = [
             r"^.+-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I
         ),
         1,
+        (38, None),
     ),
-    ("year", re.compile(r"^(?:19|20)\d{2}$"), 3),
-    ("numeric-id", re.compile(r"^\d+$"), 3),
-    ("hex-id", re.compile(r"^[0-9a-f]{20,}$", re.I), 1),
+    ("year", re.compile(r"^(?:19|20)\d{2}$"), 3, (4, 5)),
+    ("numeric-id", re.compile(r"^\d+$"), 3, (1, None)),
+    ("hex-id", re.compile(r"^[0-9a-f]{20,}$", re.I), 1, (20, None)),
 ]
 
+# Union of every pattern above: one C-level scan tells whether the first key
+# could be dynamic at all.  Per-pattern flags are kept as scoped inline flags.
+_ANY_DYNAMIC_KEY_RE = re.compile(
+    "|".join(
+        f"(?i:{regex.pattern})" if regex.flags & re.I else f"(?:{regex.pattern})"
+        for _name, regex, _min_keys, _lengths in _DYNAMIC_KEY_PATTERNS
+    )
+)
+
 _MIN_STRUCTURAL_KEYS = 5
 
 
 def _classify_key_pattern(keys: list[str]) -> str | None:
     """Return the pattern name if ALL *keys* match a single dynamic pattern."""
-    for name, regex, min_keys in _DYNAMIC_KEY_PATTERNS:
-        if len(keys) >= min_keys and all(regex.search(k) for k in keys):
+    # Ordinary field names match no pattern; reject them with a single scan.
+    if not keys or not _ANY_DYNAMIC_KEY_RE.search(keys[0]):
+        return None
+    first_len = len(keys[0])
+    for name, regex, min_keys, (min_len, max_len) in _DYNAMIC_KEY_PATTERNS:
+        if len(keys) < min_keys:
+            continue
+        # A pattern the first key's length rules out cannot match every key.
+        if first_len < min_len or (max_len is not None and first_len > max_len):
+            continue
+        # Plain loop rather than all(<genexpr>): this runs for every object
+        # node of every schema, and most nodes fail on their first key.
+        search = regex.search
+        for k in keys:
+            if not search(k):
+                break
+        else:
             return name
     return None
 
@@ -7,13 +7,34 @@ in ``_schema_analysis``.
 
 from __future__ import annotations
 
-from collections import defaultdict
 import re
 from typing import Any
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_EMAIL_RE = re.compile(r"^[^@]+@[^@]+\.[^@]+$")
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.I
+)
+_URI_RE = re.compile(r"^https?://")
 
-def _infer_type(value: Any) -> str:
+
+# Exact-type lookup for values produced by json.loads (the common case).
+_JSON_TYPE_NAMES: dict[type[object], str] = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+
+def _infer_type(value: object) -> str:
     """Infer JSON schema type from a Python value."""
+    name = _JSON_TYPE_NAMES.get(type(value))
+    if name is not None:
+        return name
+    # Subclasses (and None) fall back to the isinstance ladder.
     if isinstance(value, bool):
         return "boolean"
     if isinstance(value, int):
@@ -29,58 +50,87 @@ def _infer_type(value: Any) -> str:
     return "string"
 
 
-def _detect_format(values: list[Any]) -> str | None:
-    """Detect common string formats."""
-    str_values = [v for v in values if isinstance(v, str)]
-    if not str_values:
-        return None
+def _looks_like_date(v: str) -> bool:
+    """Positional precheck for ``_DATE_RE``: rejects most strings without the regex."""
+    return len(v) >= 10 and v[4] == "-" and v[7] == "-"
 
-    if all(re.match(r"^\d{4}-\d{2}-\d{2}", v) for v in str_values):
-        return "date-time" if any("T" in v for v in str_values) else "date"
 
-    if all(re.match(r"^[^@]+@[^@]+\.[^@]+$", v) for v in str_values):
-        return "email"
+def _looks_like_uuid(v: str) -> bool:
+    """Positional precheck for ``_UUID_RE``: length and dash positions only."""
+    return len(v) == 36 and v[8] == v[13] == v[18] == v[23] == "-"
 
-    if all(
-        re.match(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", v, re.I
-        )
-        for v in str_values
-    ):
-        return "uuid"
 
-    if all(re.match(r"^https?://", v) for v in str_values):
-        return "uri"
+def _detect_format(values: list[Any]) -> str | None:
+    """Detect common string formats.
 
+    Single pass over the values: each candidate format is dropped at its
+    first mismatch, and the scan stops once none remain.
+    """
+    is_date = is_email = is_uuid = is_uri = True
+    has_time = False
+    seen_str = False
+    for v in values:
+        if not isinstance(v, str):
+            continue
+        seen_str = True
+        if is_date:
+            if _looks_like_date(v) and _DATE_RE.match(v):
+                has_time = has_time or "T" in v
+            else:
+                is_date = False
+        if is_email and not _EMAIL_RE.match(v):
+            is_email = False
+        if is_uuid and not (_looks_like_uuid(v) and _UUID_RE.match(v)):
+            is_uuid = False
+        if is_uri and not _URI_RE.match(v):
+            is_uri = False
+        if not (is_date or is_email or is_uuid or is_uri):
+            return None
+
+    if not seen_str:
+        return None
+    if is_date:
+        return "date-time" if has_time else "date"
+    if is_email:
+        return "email"
+    if is_uuid:
+        return "uuid"
+    if is_uri:
+        return "uri"
     return None
 
 
 def _collect_examples(values: list[Any], max_count: int = 5) -> list[Any]:
-    """Collect up to *max_count* distinct example values."""
+    """Collect up to *max_count* distinct example values.
+
+    Stops scanning as soon as *max_count* have been found, so long
+    high-cardinality columns (ids, timestamps) cost only a few lookups.
+    """
     seen: list[Any] = []
-    seen_set: set[str | int | float | bool | None] = set()
+    seen_set: set[Any] = set()
     for v in values:
+        # Hash the value itself; only containers, which raise, are keyed
+        # by their str() form.
+        key: Any = v
         try:
-            hashable: str | int | float | bool | None = (
-                v if not isinstance(v, (dict, list)) else str(v)  # pyright: ignore[reportUnknownArgumentType]
-            )
-            if hashable not in seen_set:
-                seen_set.add(hashable)
-                seen.append(v)
-                if len(seen) >= max_count:
-                    break
+            duplicate = key in seen_set
         except TypeError:
-            seen.append(v)
-            if len(seen) >= max_count:
-                break
+            key = str(v)
+            duplicate = key in seen_set
+        if duplicate:
+            continue
+        seen_set.add(key)
+        seen.append(v)
+        if len(seen) >= max_count:
+            break
     return seen
 
 
 def infer_schema(samples: list[dict[str, Any]]) -> dict[str, Any]:
     """Infer a JSON schema from multiple object samples, annotated with example values.
 
-    Recursively explores nested objects and arrays of objects so that the
-    resulting schema fully describes the structure at every level.
+    Explores nested objects and arrays of objects so that the resulting
+    schema fully describes the structure at every level.
 
     Each property carries its type, optional format, and an "examples" list of up
     to 5 distinct values seen across samples.
@@ -103,25 +153,50 @@ def infer_schema(samples: list[dict[str, Any]]) -> dict[str, Any]:
     return _infer_object_schema(samples)
 
 
-def _infer_object_schema(samples: list[dict[str, Any]]) -> dict[str, Any]:
-    """Infer schema for a list of object samples (recursive)."""
-    all_keys: dict[str, list[Any]] = defaultdict(list)
-    for sample in samples:
-        for key, value in sample.items():
-            all_keys[key].append(value)
-
-    properties: dict[str, Any] = {}
-    for key, values in all_keys.items():
-        properties[key] = _infer_property(values)
+# An object level still to infer: the ``properties`` dict to fill in, and
+# the object samples observed at that level.
+_Pending = list[tuple[dict[str, Any], list[dict[str, Any]]]]
 
-    return {"type": "object", "properties": properties}
 
+def _infer_object_schema(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    """Infer schema for a list of object samples, at every nesting level.
 
-def _infer_property(values: list[Any]) -> dict[str, Any]:
-    """Infer schema for a single property from its observed values."""
+    Iterative rather than recursive: nested objects (and arrays of objects)
+    get an empty ``properties`` dict that is queued and filled in later, so
+    deeply nested bodies never approach the interpreter's recursion limit.
+    """
+    root_properties: dict[str, Any] = {}
+    pending: _Pending = [(root_properties, samples)]
+    while pending:
+        properties, level_samples = pending.pop()
+        # Plain dict rather than defaultdict: no factory call per new key,
+        # and the common case (key already present) is a get() + append.
+        all_keys: dict[str, list[Any]] = {}
+        get = all_keys.get
+        for sample in level_samples:
+            for key, value in sample.items():
+                bucket = get(key)
+                if bucket is None:
+                    all_keys[key] = [value]
+                else:
+                    bucket.append(value)
+
+        for key, values in all_keys.items():
+            properties[key] = _infer_property(values, pending)
+
+    return {"type": "object", "properties": root_properties}
+
+
+def _infer_property(values: list[Any], pending: _Pending) -> dict[str, Any]:
+    """Infer schema for a single property from its observed values.
+
+    Nested object levels are appended to *pending* instead of being inferred
+    here.
+    """
     # Skip None values when determining the type so that a leading null
     # doesn't shadow the real type (e.g. [None, {"lon": 4.8}] → object).
-    non_null = [v for v in values if v is not None]
+    # Most properties are never null; reuse the list instead of copying it.
+    non_null = [v for v in values if v is not None] if None in values else values
     representative = non_null[0] if non_null else None
     prop_type = _infer_type(representative)
     prop: dict[str, Any] = {"type": prop_type}
@@ -132,17 +207,16 @@ def _infer_property(values: list[Any]) -> dict[str, Any]:
             prop["format"] = fmt
 
     if prop_type == "object":
-        # Recurse into nested objects
+        # Queue nested objects
         dict_values: list[dict[str, Any]] = [v for v in non_null if isinstance(v, dict)]
         if dict_values:
-            nested = _infer_object_schema(dict_values)
-            for k, v in nested.items():
-                if k != "type":
-                    prop[k] = v
+            nested: dict[str, Any] = {}
+            prop["properties"] = nested
+            pending.append((nested, dict_values))
 
     if prop_type == "array":
         # Infer items schema from array contents — examples goes on items, not here
-        items_schema = _infer_array_items(non_null)
+        items_schema = _infer_array_items(non_null, pending)
         if items_schema:
             prop["items"] = items_schema
         return prop
@@ -154,7 +228,9 @@ def _infer_property(values: list[Any]) -> dict[str, Any]:
     return prop
 
 
-def _infer_array_items(array_values: list[Any]) -> dict[str, Any] | None:
+def _infer_array_items(
+    array_values: list[Any], pending: _Pending
+) -> dict[str, Any] | None:
     """Infer the items schema for an array property.
 
     Collects all elements from all observed arrays and infers a unified schema.
@@ -167,12 +243,14 @@ def _infer_array_items(array_values: list[Any]) -> dict[str, Any] | None:
     if not all_elements:
         return None
 
-    # If all elements are objects, recurse
+    # If all elements are objects, queue them as one more object level
     dict_elements: list[dict[str, Any]] = [
         e for e in all_elements if isinstance(e, dict)
     ]
     if dict_elements and len(dict_elements) == len(all_elements):
-        return _infer_object_schema(dict_elements)
+        nested: dict[str, Any] = {}
+        pending.append((nested, dict_elements))
+        return {"type": "object", "properties": nested}
 
     # Otherwise infer a scalar type from the first element
     item_type = _infer_type(all_elements[0])
@@ -34,6 +34,7 @@ from cli.formats.config import Config
 from cli.formats.mcp_tool import TokenState, ToolDefinition
 
 APP_NAME_RE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
 
 
 def validate_app_name(name: str) -> None:
@@ -99,7 +100,7 @@ def slugify(name: str) -> str:
     ``"EDF Portal"`` → ``"edf-portal"``
     """
     s = name.lower().strip()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
+    s = _SLUG_SEP_RE.sub("-", s)
     s = s.strip("-")
     return s or "app"
 
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from cli.commands.capture._mitm_gql_injection import inject_typename
+import json
+from unittest.mock import MagicMock
+
+from cli.commands.capture._mitm_gql_injection import (
+    inject_typename,
+    inject_typename_into_flow,
+)
 
 
 class TestInjectTypename:
@@ -27,8 +33,39 @@ class TestInjectTypename:
         bad_query = "this is not graphql"
         assert inject_typename(bad_query) == bad_query
 
+    def test_repeated_query_is_memoized(self):
+        query = "{ viewer { id } }"
+        first = inject_typename(query)
+        assert inject_typename(query) is first
+
     def test_mutation(self):
         result = inject_typename(
             "mutation { createUser(name: \"Bob\") { id } }"
         )
         assert "__typename" in result
+
+
+def _post_flow(body: bytes) -> MagicMock:
+    flow = MagicMock()
+    flow.request.method = "POST"
+    flow.request.headers = {"content-type": "application/json"}
+    flow.request.content = body
+    return flow
+
+
+class TestInjectTypenameIntoFlow:
+    def test_graphql_body_rewritten(self):
+        flow = _post_flow(json.dumps({"query": "{ user { name } }"}).encode())
+        inject_typename_into_flow(flow)
+        assert "__typename" in json.loads(flow.request.content)["query"]
+
+    def test_batch_body_rewritten(self):
+        flow = _post_flow(json.dumps([{"query": "{ a { b } }"}]).encode())
+        inject_typename_into_flow(flow)
+        assert "__typename" in json.loads(flow.request.content)[0]["query"]
+
+    def test_rest_body_left_untouched(self):
+        body = b'{"name": "Bob", "tags": ["a", "b"]}'
+        flow = _post_flow(body)
+        inject_typename_into_flow(flow)
+        assert flow.request.content is body
@@ -305,9 +305,8 @@ class TestRunMitmproxyIgnoreHosts:
         mock_master.run.return_value = _noop()
         mock_master_cls.return_value = mock_master
 
-        # Make proxy_thread.is_alive() return False immediately
-        with patch("cli.commands.capture._mitmproxy.threading.Thread") as mock_thread:
-            mock_thread.return_value.is_alive.return_value = False
+        # Mocked proxy_thread.join() returns immediately
+        with patch("cli.commands.capture._mitmproxy.threading.Thread"):
             from cli.commands.capture._mitmproxy import run_mitmproxy
 
             run_mitmproxy(
@@ -35,8 +35,11 @@ def _extract_user_prompt(messages: list[Any]) -> str:
 
 
 
-def _setup_openapi_llm() -> None:
-    """Set up a FunctionModel for OpenAPI analysis tests."""
+def _setup_openapi_llm(calls: list[str] | None = None) -> None:
+    """Set up a FunctionModel for OpenAPI analysis tests.
+
+    When *calls* is given, each model request appends its user prompt.
+    """
 
     groups_response = json.dumps(
         {"items": [
@@ -74,6 +77,8 @@ def _setup_openapi_llm() -> None:
 
     def model_fn(messages: list[Any], info: AgentInfo) -> ModelResponse:
         prompt = _extract_user_prompt(messages)
+        if calls is not None:
+            calls.append(prompt)
 
         if "base URL" in prompt and "business API" in prompt:
             text = base_url_response
@@ -125,6 +130,40 @@ class TestAnalyzeCommand:
         assert openapi["openapi"] == "3.1.0"
         assert openapi["info"]["title"] == "Test App API"
 
+    def test_analyze_replays_cached_responses_and_no_cache_refreshes(
+        self, sample_bundle: CaptureBundle, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        from cli.formats.config import Config
+        from cli.helpers.storage import store_capture, write_config
+
+        monkeypatch.setenv("SPECTRAL_HOME", str(tmp_path / "store"))
+        write_config(Config(api_key="sk-ant-test-key"))
+        store_capture(sample_bundle, "testapp")
+        args = ["openapi", "analyze", "testapp", "-o", str(tmp_path / "spec.yaml")]
+        runner = CliRunner()
+
+        first: list[str] = []
+        _setup_openapi_llm(first)
+        assert runner.invoke(cli, args).exit_code == 0
+        assert first
+
+        replayed: list[str] = []
+        _setup_openapi_llm(replayed)
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0, result.output
+        assert replayed == []
+
+        fresh: list[str] = []
+        _setup_openapi_llm(fresh)
+        assert runner.invoke(cli, [*args, "--no-cache"]).exit_code == 0
+        assert fresh
+
+        # --no-cache refreshed the entries it called for; a plain run replays them.
+        refreshed: list[str] = []
+        _setup_openapi_llm(refreshed)
+        assert runner.invoke(cli, args).exit_code == 0
+        assert refreshed == []
+
     def test_analyze_produces_endpoints(
         self, sample_bundle: CaptureBundle, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
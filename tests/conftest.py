@@ -7,6 +7,7 @@ import json
 
 import pytest
 
+from cli.helpers.llm._cache import clear_cache_dir
 from cli.helpers.llm._cost import reset_usage
 from cli.helpers.llm._debug import clear_debug_dir
 from cli.helpers.llm.providers.testing import clear_test_model
@@ -18,10 +19,12 @@ def reset_llm_globals():
     clear_test_model()
     reset_usage()
     clear_debug_dir()
+    clear_cache_dir()
     yield
     clear_test_model()
     reset_usage()
     clear_debug_dir()
+    clear_cache_dir()
 
 from cli.commands.capture.types import (
     CaptureBundle,
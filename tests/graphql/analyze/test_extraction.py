@@ -6,7 +6,9 @@ from __future__ import annotations
 import pytest
 
 from cli.commands.graphql.analyze.extraction import (
+    _build_trace_response_map,
     _capitalize_field_name,
+    _index_responses_by_query,
     _infer_literal_type,
     _infer_scalar,
     _is_enum_literal,
@@ -43,6 +45,21 @@ class TestExtractSimple:
         assert "createUser" in schema.root_mutation_fields
 
 
+class TestIndexResponsesByQuery:
+    def test_first_body_with_query_wins(self):
+        traces = [
+            gql_trace("query A { a }", response_data={"a": 1}, trace_id="t_0001"),
+            gql_trace(
+                "query A { a }", response_data={"a": 2},
+                variables={"x": 1}, trace_id="t_0002",
+            ),
+            gql_trace("query B { b }", response_data={"b": 3}, trace_id="t_0003"),
+        ]
+        index = _index_responses_by_query(_build_trace_response_map(traces))
+        assert index["query A { a }"] == {"data": {"a": 1}}
+        assert index["query B { b }"] == {"data": {"b": 3}}
+
+
 class TestScalarInference:
     def test_string_inferred(self):
         assert _infer_scalar("hello") == "String"
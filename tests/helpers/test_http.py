@@ -1,7 +1,11 @@
 """Tests for cli/helpers/http.py."""
 
+from urllib.parse import urlparse
+
+import pytest
+
 from cli.formats.capture_bundle import Header
-from cli.helpers.http import get_header
+from cli.helpers.http import get_header, url_path
 
 
 class TestGetHeader:
@@ -23,3 +27,22 @@ class TestGetHeader:
             Header(name="X-Custom", value="second"),
         ]
         assert get_header(headers, "X-Custom") == "first"
+
+
+class TestUrlPath:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://api.example.com/users/1?page=2#top",
+            "https://api.example.com",
+            "https://api.example.com?next=/a/b",
+            "https://api.example.com#/route?x=1",
+            "http://user:pw@host:8080/a%20b/",
+            "https://host/a;jsessionid=1/b;v=2",
+            "/relative/path?x=1",
+            "//host/path",
+            "https://host/a\tb",
+        ],
+    )
+    def test_matches_urlparse(self, url: str) -> None:
+        assert url_path(url) == urlparse(url).path
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -24,9 +25,14 @@ class _SampleModel(BaseModel):
     name: str | None = None
 
 
-def _text_model(text: str) -> FunctionModel:
-    """Create a FunctionModel that always returns the given text."""
+def _text_model(text: str, calls: list[int] | None = None) -> FunctionModel:
+    """Create a FunctionModel that always returns the given text.
+
+    When *calls* is given, one entry is appended per model request.
+    """
     def model_fn(messages: list[Any], info: AgentInfo) -> ModelResponse:
+        if calls is not None:
+            calls.append(1)
         if info.output_tools:
             return ModelResponse(parts=[
                 ToolCallPart(
@@ -128,6 +134,124 @@ class TestConversationDebug:
         assert "test_label" in files[0].name
 
 
+class TestConversationCache:
+    def _counting_model(self, text: str) -> tuple[FunctionModel, list[int]]:
+        calls: list[int] = []
+        return _text_model(text, calls), calls
+
+    def test_replays_identical_request(self, tmp_path: Path):
+        llm.init_cache(cache_dir=tmp_path / "cache")
+        model, calls = self._counting_model('{"useful": true, "name": "search"}')
+        set_test_model(model)
+
+        first = llm.Conversation().ask_json("same prompt", _SampleModel)
+        second = llm.Conversation().ask_json("same prompt", _SampleModel)
+
+        assert len(calls) == 1
+        assert second == first
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_different_prompt_misses(self, tmp_path: Path):
+        llm.init_cache(cache_dir=tmp_path / "cache")
+        model, calls = self._counting_model("ok")
+        set_test_model(model)
+
+        llm.Conversation().ask_text("first")
+        llm.Conversation().ask_text("second")
+
+        assert len(calls) == 2
+
+    def test_follow_up_turn_sees_replayed_history(self, tmp_path: Path):
+        llm.init_cache(cache_dir=tmp_path / "cache")
+        model, calls = self._counting_model("ok")
+        set_test_model(model)
+
+        conv = llm.Conversation()
+        conv.ask_text("first")
+        conv.ask_text("second")
+
+        replay = llm.Conversation()
+        replay.ask_text("first")
+        replay.ask_text("second")
+
+        assert len(calls) == 2
+        assert len(replay._messages) == len(conv._messages)
+
+    def test_hit_is_logged_to_debug_and_usage_summary(self, tmp_path: Path):
+        llm.init_cache(cache_dir=tmp_path / "cache")
+        debug_dir = tmp_path / "debug"
+        debug_dir.mkdir()
+        llm.init_debug(debug=True, debug_dir=debug_dir)
+        set_test_model(_text_model("cached answer"))
+
+        llm.Conversation(label="miss").ask_text("hello")
+        llm.Conversation(label="hit").ask_text("hello")
+
+        (hit_file,) = [f for f in debug_dir.iterdir() if "hit" in f.name]
+        content = hit_file.read_text()
+        assert "=== CACHED" in content
+        assert "hello" in content
+        assert "cached answer" in content
+
+        with patch("cli.helpers.llm._cost.console") as mock_console:
+            llm.print_usage_summary()
+        assert "1 call(s) replayed from cache" in mock_console.print.call_args[0][0]
+
+    def test_refresh_skips_lookup_but_stores_response(self, tmp_path: Path):
+        cache_dir = tmp_path / "cache"
+        llm.init_cache(cache_dir=cache_dir)
+        set_test_model(_text_model("stale"))
+        llm.Conversation().ask_text("hello")
+
+        llm.init_cache(refresh=True, cache_dir=cache_dir)
+        model, calls = self._counting_model("fresh")
+        set_test_model(model)
+        assert llm.Conversation().ask_text("hello") == "fresh"
+        assert len(calls) == 1
+
+        llm.init_cache(cache_dir=cache_dir)
+        assert llm.Conversation().ask_text("hello") == "fresh"
+        assert len(calls) == 1
+
+    def test_entries_written_without_leftover_temp_files(self, tmp_path: Path):
+        llm.init_cache(cache_dir=tmp_path / "cache")
+        set_test_model(_text_model("ok"))
+
+        llm.Conversation().ask_text("first")
+        llm.Conversation().ask_text("second")
+
+        names = [f.name for f in (tmp_path / "cache").iterdir()]
+        assert len(names) == 2
+        assert all(n.endswith(".json") and not n.startswith(".") for n in names)
+
+    def test_disabled_until_initialized(self):
+        model, calls = self._counting_model("ok")
+        set_test_model(model)
+
+        llm.Conversation().ask_text("hello")
+        llm.Conversation().ask_text("hello")
+
+        assert len(calls) == 2
+
+
+class TestGatherBounded:
+    def test_results_in_order_with_bounded_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def call(i: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (i % 3))
+            in_flight -= 1
+            return i
+
+        results = asyncio.run(llm.gather_bounded((call(i) for i in range(10)), limit=3))
+        assert results == list(range(10))
+        assert peak == 3
+
+
 class TestPrintUsageSummary:
     def test_prints_after_calls(self):
         set_test_model(_text_model("a"))
@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 
 from cli.helpers.http import sanitize_headers
 from cli.helpers.llm.tools import make_tools
@@ -259,6 +261,14 @@ class TestMakeTools:
         assert "inspect_context" in tool_names
         assert len(tools) == 8
 
+    def test_ctx_tools_take_run_context(self) -> None:
+        tools = make_tools(["inspect_trace", "decode_url"])
+        assert [t.takes_ctx for t in tools] == [True, False]
+
+    def test_cli_import_does_not_load_pydantic_ai(self) -> None:
+        code = "import sys, cli.main; sys.exit('pydantic_ai' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
 
 class TestSanitizeHeaders:
     def test_strips_noise_headers(self) -> None:
@@ -5,8 +5,13 @@ from collections import Counter
 from jinja2 import UndefinedError
 import pytest
 
+from cli.formats.capture_bundle import Header
 from cli.formats.mcp_tool import ToolDefinition, ToolRequest
-from cli.helpers.prompt import load, render
+from cli.helpers.prompt import (
+    _is_auth_trace,  # pyright: ignore[reportPrivateUsage]
+    load,
+    render,
+)
 from tests.conftest import make_trace
 
 
@@ -68,3 +73,19 @@ def test_render_conditional_sections():
     )
     assert "tool_a" not in result_without
     assert "t_0001" in result_without
+
+
+def test_is_auth_trace():
+    def url_trace(url: str):
+        return make_trace("t_0001", "GET", url, 200, 1000)
+
+    assert _is_auth_trace(url_trace("https://example.com/OAuth/Token"))
+    assert _is_auth_trace(url_trace("https://example.com/api/signin"))
+    assert not _is_auth_trace(url_trace("https://example.com/api/users"))
+    assert _is_auth_trace(make_trace("t_0002", "GET", "https://example.com/me", 401, 1000))
+    assert _is_auth_trace(
+        make_trace(
+            "t_0003", "GET", "https://example.com/me", 200, 1000,
+            request_headers=[Header(name="AUTHORIZATION", value="Bearer x")],
+        )
+    )
@@ -1,7 +1,11 @@
 """Tests for schema inference utilities."""
 
+import sys
 from typing import Any
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
+
+import pytest
 
 from cli.helpers.schema import (
     analyze_schema,
@@ -9,6 +13,16 @@ from cli.helpers.schema import (
     infer_query_schema,
     infer_schema,
 )
+from cli.helpers.schema._params import (
+    _compile_path_pattern,  # pyright: ignore[reportPrivateUsage]
+)
+from cli.helpers.schema._query import (
+    _first_query_values,  # pyright: ignore[reportPrivateUsage]
+)
+from cli.helpers.schema._scalars import coerce_value
+from cli.helpers.schema._schema_analysis import (
+    _classify_key_pattern,  # pyright: ignore[reportPrivateUsage]
+)
 from tests.conftest import make_trace
 
 
@@ -68,6 +82,68 @@ class TestInferSchema:
         schema = infer_schema(samples)
         assert schema["properties"]["created_at"]["format"] == "date-time"
 
+    def test_format_requires_every_value_to_match(self):
+        samples = [
+            {"day": "2024-01-15", "contact": "a@b.io", "link": "https://x.io"},
+            {"day": "2024-02-20", "contact": "nobody", "link": "https://y.io"},
+        ]
+        props = infer_schema(samples)["properties"]
+        assert props["day"]["format"] == "date"
+        assert "format" not in props["contact"]
+        assert props["link"]["format"] == "uri"
+
+    def test_repeated_samples_do_not_change_schema(self):
+        a = {"id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890", "n": 1, "o": {"k": [1]}}
+        b = {"id": "b1b2c3d4-e5f6-7890-abcd-ef1234567890", "n": 2, "o": {"k": [2]}}
+        assert infer_schema([a, b, a, a, b]) == infer_schema([a, b])
+
+    def test_deeply_nested_objects_do_not_hit_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 2
+        leaf: dict[str, Any] = {"v": 1}
+        sample: dict[str, Any] = leaf
+        for _ in range(depth):
+            sample = {"n": sample}
+        node = infer_schema([sample, sample])
+        for _ in range(depth):
+            node = node["properties"]["n"]
+        assert node["properties"]["v"]["type"] == "integer"
+
+    def test_scalar_types(self):
+        samples = [{"b": True, "i": 3, "f": 1.5, "s": "x", "a": [1], "o": {"k": 1}}]
+        props = infer_schema(samples)["properties"]
+        assert {k: v["type"] for k, v in props.items()} == {
+            "b": "boolean",
+            "i": "integer",
+            "f": "number",
+            "s": "string",
+            "a": "array",
+            "o": "object",
+        }
+
+    def test_near_miss_dates_and_uuids_get_no_format(self):
+        samples = [
+            {"d": "2024/01/15", "u": "a1b2c3d4-e5f6-7890-abcd-ef123456789"},
+            {"d": "2024-1-15", "u": "a1b2c3d4e5f6-7890-abcd-ef1234567890"},
+            {"d": "2024-01-15", "u": "a1b2c3d4-e5f6-7890-abcd-ef1234567890\n"},
+        ]
+        props = infer_schema(samples)["properties"]
+        assert "format" not in props["d"]
+        assert "format" not in props["u"]
+
+    def test_late_non_matching_value_drops_format(self):
+        samples = [{"u": "a1b2c3d4-e5f6-7890-abcd-ef1234567890"}] * 50
+        samples.append({"u": "not-a-uuid"})
+        assert "format" not in infer_schema(samples)["properties"]["u"]
+
+    def test_examples_distinct_in_first_seen_order(self):
+        samples = [{"n": v} for v in [3, 1, 3, 2, 1, 5, 4, 6, 7]]
+        assert infer_schema(samples)["properties"]["n"]["examples"] == [3, 1, 2, 5, 4]
+
+    def test_examples_of_nested_arrays(self):
+        samples = [{"grid": [[1, 2], [1, 2], [3]]}]
+        items = infer_schema(samples)["properties"]["grid"]["items"]
+        assert items["examples"] == [[1, 2], [3]]
+
     def test_empty_samples(self):
         schema = infer_schema([])
         assert schema["type"] == "object"
@@ -169,7 +245,31 @@ class TestInferSchema:
         assert schema["properties"]["x"]["type"] == "string"
 
 
+class TestCoerceValue:
+    def test_words_stay_strings(self):
+        assert coerce_value("hello") == "hello"
+        assert coerce_value("-") == "-"
+
+    def test_numeric_spellings(self):
+        assert coerce_value("1e3") == 1000.0
+        assert coerce_value(" -Inf ") == float("-inf")
+        assert coerce_value("nan") != coerce_value("nan")  # NaN, not the string
+
+    def test_booleans(self):
+        assert coerce_value("TRUE") is True
+        assert coerce_value("false") is False
+
+
 class TestInferPathSchema:
+    def test_pattern_compiled_once(self):
+        first = _compile_path_pattern("/users/{user_id}/orders/{order_id}")
+        assert first[1] == ("user_id", "order_id")
+        assert _compile_path_pattern("/users/{user_id}/orders/{order_id}") is first
+
+    def test_brace_without_param_name_returns_none(self):
+        traces = [make_trace("t_0001", "GET", "https://api.example.com/a(b", 200, 1000)]
+        assert infer_path_schema(traces, "/a({b") is None
+
     def test_no_params_returns_none(self):
         traces = [
             make_trace("t_0001", "GET", "https://api.example.com/users", 200, 1000),
@@ -235,6 +335,27 @@ class TestInferPathSchema:
         assert schema["properties"]["user_id"]["type"] == "integer"
 
 
+class TestFirstQueryValues:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",
+            "a=1&b=2",
+            "a=1&a=2",
+            "a=&a=2",
+            "flag&a=1",
+            "a=1&&b=2",
+            "q=hello+world&r=%C3%A9t%C3%A9",
+            "a%20b=1",
+            "=x&eq=1=2",
+            "bad=%ZZ",
+        ],
+    )
+    def test_matches_parse_qs_first_values(self, query: str):
+        expected = {k: v[0] for k, v in parse_qs(query).items()}
+        assert _first_query_values(query) == expected
+
+
 class TestInferQuerySchema:
     def test_no_query_params_returns_none(self):
         traces = [
@@ -242,6 +363,16 @@ class TestInferQuerySchema:
         ]
         assert infer_query_schema(traces) is None
 
+    def test_fragment_and_encoding(self):
+        traces = [
+            make_trace("t_0001", "GET", "https://api.example.com/s?q=a%20b#top", 200, 1000),
+            make_trace("t_0002", "GET", "https://api.example.com/s#x?y=1", 200, 2000),
+        ]
+        schema = infer_query_schema(traces)
+        assert schema is not None
+        assert list(schema["properties"]) == ["q"]
+        assert schema["properties"]["q"]["examples"] == ["a b"]
+
     def test_basic_query_params(self):
         traces = [
             make_trace(
@@ -268,6 +399,25 @@ class TestInferQuerySchema:
         assert "required" not in schema
         assert len(schema["properties"]["id"]["examples"]) == 2
 
+    def test_scalar_coercion(self):
+        traces = [
+            make_trace(
+                "t_0001", "GET",
+                "https://api.example.com/s?flag=True&ratio=0.5&name=inf-x", 200, 1000,
+            ),
+            make_trace(
+                "t_0002", "GET",
+                "https://api.example.com/s?flag=false&ratio=2&name=bob", 200, 2000,
+            ),
+        ]
+        schema = infer_query_schema(traces)
+        assert schema is not None
+        props = schema["properties"]
+        assert props["flag"]["type"] == "boolean"
+        assert props["flag"]["examples"] == [True, False]
+        assert props["ratio"]["type"] == "number"
+        assert props["name"]["examples"] == ["inf-x", "bob"]
+
     def test_integer_type(self):
         traces = [
             make_trace(
@@ -516,6 +666,25 @@ class TestDynamicKeyDetection:
         assert "additionalProperties" in schema
         assert schema["x-key-pattern"] == "uuid"
 
+    def test_classify_key_pattern_length_prechecks(self):
+        assert _classify_key_pattern([]) is None
+        # First key rules out "year" by length; later keys still decide.
+        assert _classify_key_pattern(["7", "1999", "123456"]) == "numeric-id"
+        assert _classify_key_pattern(["1999", "2000", "2001"]) == "year"
+        assert _classify_key_pattern(["2024-01", "2024-02", "2024-03"]) == "year-month"
+        assert _classify_key_pattern(["2024-01", "2024-02", "2024-03-01"]) is None
+        # ``$`` matches before a trailing newline; the bounds must not reject it.
+        assert _classify_key_pattern(["2024\n", "2025\n", "2026\n"]) == "year"
+        assert (
+            _classify_key_pattern(["user-a1b2c3d4-e5f6-7890-abcd-ef1234567890"])
+            == "prefixed-uuid"
+        )
+        assert _classify_key_pattern(["name", "email", "created_at"]) is None
+
+    def test_classify_key_pattern_keeps_case_insensitive_patterns(self):
+        assert _classify_key_pattern(["A1B2C3D4-E5F6-7890-ABCD-EF1234567890"]) == "uuid"
+        assert _classify_key_pattern(["87B3BF6D86DB3C23BDA9321AC4699132DFBC9F28"]) == "hex-id"
+
 
 class TestStructuralAnnotation:
     def test_structural_candidate_resolved(self):
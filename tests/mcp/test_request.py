@@ -28,6 +28,13 @@ class TestResolveUrl:
         )
         assert url == "https://api.example.com/api/users/123/orders/456"
 
+    def test_missing_param_left_as_placeholder(self) -> None:
+        url = _resolve_url(
+            "https://api.example.com/api/users/{user_id}/orders/{order_id}",
+            {"user_id": 123},
+        )
+        assert url == "https://api.example.com/api/users/123/orders/{order_id}"
+
 
 class TestResolveQuery:
     def test_literal_values(self) -> None:
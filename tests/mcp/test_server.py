@@ -14,6 +14,7 @@ from cli.commands.mcp.server import (
     _apply_defaults,
     _build_registry,
     _create_server,
+    _get_http_session,
     _handle_call,
     _registry,
 )
@@ -106,9 +107,29 @@ class TestListTools:
         assert any(t.name == "testapp_search" for t in list_result.tools)
 
 
+class TestHttpSession:
+    def test_session_is_reused(self) -> None:
+        assert _get_http_session() is _get_http_session()
+
+    def test_session_does_not_store_cookies(self) -> None:
+        from email.message import Message
+        from urllib.request import Request
+
+        headers = Message()
+        headers["Set-Cookie"] = "sid=abc; Path=/"
+        response = MagicMock()
+        response.info.return_value = headers
+
+        session = _get_http_session()
+        session.cookies.extract_cookies(
+            response, Request("https://api.example.com/login")
+        )
+        assert len(session.cookies) == 0
+
+
 class TestCallTool:
     @pytest.mark.asyncio
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_call_tool_success(
         self,
         mock_request: MagicMock,
@@ -139,7 +160,7 @@ class TestCallTool:
         assert call_kwargs.kwargs["json"] == {"query": "hello"}
 
     @pytest.mark.asyncio
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_call_tool_with_auth(
         self,
         mock_request: MagicMock,
@@ -180,7 +201,7 @@ class TestCallTool:
         assert headers["Authorization"] == "Bearer tok123"
 
     @pytest.mark.asyncio
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_call_tool_with_auth_body_params(
         self,
         mock_request: MagicMock,
@@ -223,7 +244,7 @@ class TestCallTool:
         assert body["query"] == "test"
 
     @pytest.mark.asyncio
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_call_tool_http_error(
         self,
         mock_request: MagicMock,
@@ -264,7 +285,7 @@ class TestCallTool:
         assert "spectral auth login" in parsed["error"]
 
     @pytest.mark.asyncio
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_call_tool_no_auth_skips_auth(
         self,
         mock_request: MagicMock,
@@ -336,7 +357,7 @@ class TestCatalogToolsInRegistry:
 
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Stats recording disabled until batched approach is implemented")
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_catalog_tool_records_stats(
         self,
         mock_request: MagicMock,
@@ -367,7 +388,7 @@ class TestCatalogToolsInRegistry:
 
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Stats recording disabled until batched approach is implemented")
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_stats_recorded_on_http_error(
         self,
         mock_request: MagicMock,
@@ -432,7 +453,7 @@ class TestApplyDefaults:
 
 class TestCallToolWithDefaults:
     @pytest.mark.asyncio
-    @patch("requests.request")
+    @patch("requests.Session.request")
     async def test_call_tool_applies_defaults(
         self,
         mock_request: MagicMock,
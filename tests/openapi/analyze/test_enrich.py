@@ -1,14 +1,16 @@
 """Tests for REST enrichment application."""
 # pyright: reportPrivateUsage=false
 
+import asyncio
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from cli.commands.openapi.analyze.enrich import (
     _apply_enrichment,
     _build_endpoint_summary,
     enrich_endpoints,
 )
+from cli.commands.openapi.analyze.extraction import index_by_method
 from cli.commands.openapi.analyze.types import (
     EndpointEnrichmentResponse,
     EndpointSpec,
@@ -17,6 +19,9 @@ from cli.commands.openapi.analyze.types import (
     ResponseDetail,
     ResponseSpec,
 )
+from cli.helpers.correlator import Correlation
+import cli.helpers.llm as llm
+from tests.conftest import make_context, make_trace
 
 
 class TestEnrichSizeGuard:
@@ -49,11 +54,11 @@ class TestEnrichSizeGuard:
             base_url="https://api.example.com",
         )
 
-        mock_ask_json = MagicMock(return_value=EndpointEnrichmentResponse(description="should not be called"))
-        with patch("cli.commands.openapi.analyze.enrich.llm") as mock_llm:
+        mock_ask_json = AsyncMock(return_value=EndpointEnrichmentResponse(description="should not be called"))
+        with patch("cli.commands.openapi.analyze.enrich.llm.Conversation") as mock_cls:
             mock_conv = MagicMock()
-            mock_conv.ask_json = mock_ask_json
-            mock_llm.Conversation.return_value = mock_conv
+            mock_conv.ask_json_async = mock_ask_json
+            mock_cls.return_value = mock_conv
             result = enrich_endpoints(ctx)
 
         mock_ask_json.assert_not_called()
@@ -86,17 +91,60 @@ class TestEnrichSizeGuard:
             base_url="https://api.example.com",
         )
 
-        mock_ask_json = MagicMock(return_value=EndpointEnrichmentResponse(description="Returns a user"))
-        with patch("cli.commands.openapi.analyze.enrich.llm") as mock_llm:
+        mock_ask_json = AsyncMock(return_value=EndpointEnrichmentResponse(description="Returns a user"))
+        with patch("cli.commands.openapi.analyze.enrich.llm.Conversation") as mock_cls:
             mock_conv = MagicMock()
-            mock_conv.ask_json = mock_ask_json
-            mock_llm.Conversation.return_value = mock_conv
+            mock_conv.ask_json_async = mock_ask_json
+            mock_cls.return_value = mock_conv
             result = enrich_endpoints(ctx)
 
         mock_ask_json.assert_called_once()
         assert result[0].description == "Returns a user"
 
 
+class TestEnrichConcurrency:
+    def test_enriches_every_endpoint_with_bounded_concurrency(self):
+        """Calls share one event loop, at most llm.MAX_CONCURRENT_CALLS in flight."""
+        endpoints = [
+            EndpointSpec(id=f"ep_{i}", path=f"/items/{i}", method="GET")
+            for i in range(20)
+        ]
+        ctx = EnrichmentContext(
+            endpoints=endpoints,
+            traces=[],
+            correlations=[],
+            app_name="test",
+            base_url="https://api.example.com",
+        )
+        in_flight = 0
+        peak = 0
+
+        def make_conv(**kwargs: Any) -> MagicMock:
+            async def ask_json_async(prompt: str, model: Any) -> EndpointEnrichmentResponse:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return EndpointEnrichmentResponse(description=f"described {kwargs['label']}")
+
+            conv = MagicMock()
+            conv.ask_json_async = ask_json_async
+            return conv
+
+        with patch(
+            "cli.commands.openapi.analyze.enrich.llm.Conversation",
+            side_effect=make_conv,
+        ):
+            result = enrich_endpoints(ctx)
+
+        assert [ep.id for ep in result] == [f"ep_{i}" for i in range(20)]
+        assert [ep.description for ep in result] == [
+            f"described enrich_ep_{i}" for i in range(20)
+        ]
+        assert 1 < peak <= llm.MAX_CONCURRENT_CALLS
+
+
 class TestApplyEnrichment:
     def test_discovery_notes(self):
         endpoint = EndpointSpec(id="test", path="/test", method="GET")
@@ -416,7 +464,7 @@ class TestResponseSchemaTrimming:
                 ),
             ],
         )
-        summary = _build_endpoint_summary(ep, [], [])
+        summary = _build_endpoint_summary(ep, index_by_method([]), [])
         # Response entry should exist but without a schema key
         assert len(summary["responses"]) == 1
         assert summary["responses"][0]["status"] == 200
@@ -440,9 +488,24 @@ class TestResponseSchemaTrimming:
                 ),
             ],
         )
-        summary = _build_endpoint_summary(ep, [], [])
+        summary = _build_endpoint_summary(ep, index_by_method([]), [])
         assert len(summary["responses"]) == 1
         assert "schema" in summary["responses"][0]
         assert summary["responses"][0]["schema"]["properties"]["name"]["examples"] == [
             "Alice"
         ]
+
+
+class TestUiTriggers:
+    def test_only_correlations_with_matching_traces(self):
+        users = make_trace("t_0001", "GET", "https://api.example.com/users/1", 200, 1000)
+        orders = make_trace("t_0002", "GET", "https://api.example.com/orders", 200, 3000)
+        correlations = [
+            Correlation(context=make_context("c_0001", 900, text="Profile"), traces=[users]),
+            Correlation(context=make_context("c_0002", 2900, text="Orders"), traces=[orders]),
+        ]
+        ep = EndpointSpec(id="get_users_id", path="/users/{id}", method="GET")
+        summary = _build_endpoint_summary(
+            ep, index_by_method([users, orders]), correlations
+        )
+        assert [t["element_text"] for t in summary["ui_triggers"]] == ["Profile"]
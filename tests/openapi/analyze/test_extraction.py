@@ -2,12 +2,17 @@
 # pyright: reportPrivateUsage=false
 
 import json
+from unittest.mock import patch
 
+from cli.commands.capture.types import Trace
 from cli.commands.openapi.analyze.extraction import (
     _build_endpoint_mechanical,
     _make_endpoint_id,
+    _may_be_json_object,
     extract_rate_limit,
-    find_traces_for_group,
+    index_by_method,
+    match_traces_by_pattern,
+    mechanical_extraction,
 )
 from cli.commands.openapi.analyze.types import EndpointGroup
 from cli.formats.capture_bundle import Header
@@ -25,6 +30,16 @@ class TestEndpointId:
         assert _make_endpoint_id("GET", "/") == "get"
 
 
+def _group_traces(group: EndpointGroup, traces: list[Trace]) -> list[Trace]:
+    """Traces that ``mechanical_extraction`` assigns to *group*."""
+    with patch(
+        "cli.commands.openapi.analyze.extraction._build_endpoint_mechanical",
+        wraps=_build_endpoint_mechanical,
+    ) as build:
+        mechanical_extraction([group], traces)
+    return build.call_args.args[2]
+
+
 class TestFindTracesForGroup:
     def test_finds_by_url(self):
         traces = [
@@ -40,7 +55,7 @@ class TestFindTracesForGroup:
                 "https://api.example.com/users/456",
             ],
         )
-        matched = find_traces_for_group(group, traces)
+        matched = _group_traces(group, traces)
         assert len(matched) == 2
         assert all(t.meta.request.method == "GET" for t in matched)
 
@@ -55,9 +70,71 @@ class TestFindTracesForGroup:
             pattern="/users/{user_id}",
             urls=["https://api.example.com/users/123"],
         )
-        matched = find_traces_for_group(group, traces)
+        matched = _group_traces(group, traces)
         assert len(matched) == 2
 
+    def test_listed_urls_before_pattern_matches(self):
+        traces = [
+            make_trace("t_0001", "GET", "https://api.example.com/users/1", 200, 1000),
+            make_trace("t_0002", "get", "https://api.example.com/users/2", 200, 2000),
+            make_trace("t_0003", "POST", "https://api.example.com/users/3", 200, 3000),
+        ]
+        group = EndpointGroup(
+            method="GET",
+            pattern="/users/{user_id}",
+            urls=["https://api.example.com/users/2"],
+        )
+        matched = _group_traces(group, traces)
+        assert [t.meta.id for t in matched] == ["t_0002", "t_0001"]
+
+
+class TestMatchTracesByPattern:
+    def test_matches_method_and_path_from_index(self):
+        traces = [
+            make_trace("t_0001", "get", "https://api.example.com/users/1", 200, 1000),
+            make_trace("t_0002", "GET", "https://api.example.com/orders/2", 200, 2000),
+            make_trace("t_0003", "POST", "https://api.example.com/users/3", 200, 3000),
+        ]
+        index = index_by_method(traces)
+        assert [
+            t.meta.id for t in match_traces_by_pattern("GET", "/users/{id}", index)
+        ] == ["t_0001"]
+        assert [
+            t.meta.id for t in match_traces_by_pattern("POST", "/users/{id}", index)
+        ] == ["t_0003"]
+        assert match_traces_by_pattern("DELETE", "/users/{id}", index) == []
+
+
+class TestMayBeJsonObject:
+    def test_objects_pass(self):
+        assert _may_be_json_object(b'{"a": 1}')
+        assert _may_be_json_object(b' \r\n\t{"a": 1}')
+        assert _may_be_json_object(b'\xef\xbb\xbf {"a": 1}')
+        assert _may_be_json_object(b" " * 100 + b"{}")
+
+    def test_non_objects_rejected(self):
+        assert not _may_be_json_object(b"[1, 2]")
+        assert not _may_be_json_object(b"<html></html>")
+        assert not _may_be_json_object(b'"text"')
+        assert not _may_be_json_object(b"\x89PNG\r\n")
+
+
+class TestMechanicalExtraction:
+    def test_attaches_rate_limit_per_group(self):
+        traces = [
+            make_trace(
+                "t_0001", "GET", "https://api.example.com/limited", 200, 1000,
+                response_headers=[Header(name="Retry-After", value="30")],
+            ),
+            make_trace("t_0002", "GET", "https://api.example.com/free", 200, 2000),
+        ]
+        groups = [
+            EndpointGroup(method="GET", pattern="/limited", urls=["https://api.example.com/limited"]),
+            EndpointGroup(method="GET", pattern="/free", urls=["https://api.example.com/free"]),
+        ]
+        endpoints = mechanical_extraction(groups, traces)
+        assert [ep.rate_limit for ep in endpoints] == ["retry-after=30", None]
+
 
 class TestBuildEndpointMechanical:
     def test_basic_endpoint(self):
@@ -76,6 +153,41 @@ class TestBuildEndpointMechanical:
         assert endpoint.method == "GET"
         assert endpoint.path == "/api/users"
 
+    def test_response_example_and_schema_from_one_parse(self):
+        url = "https://api.example.com/items"
+        traces = [
+            make_trace("t_0001", "GET", url, 200, 1000, response_body=b"<html/>"),
+            make_trace("t_0002", "GET", url, 200, 2000, response_body=b"[1, 2]"),
+            make_trace("t_0003", "GET", url, 200, 3000, response_body=b'{"id": 7}'),
+        ]
+        endpoint = _build_endpoint_mechanical("GET", "/items", traces)
+        (resp,) = endpoint.responses
+        assert resp.example_body == [1, 2]
+        assert resp.schema_ is not None
+        assert resp.schema_["properties"]["id"]["examples"] == [7]
+
+    def test_identical_bodies_parsed_once(self):
+        url = "https://api.example.com/poll"
+        bodies = [b'{"status": "pending"}'] * 5 + [b'{"status": "done"}']
+        traces = [
+            make_trace(f"t_{i:04d}", "POST", url, 200, i, request_body=b, response_body=b)
+            for i, b in enumerate(bodies)
+        ]
+        with patch(
+            "cli.commands.openapi.analyze.extraction.json.loads", wraps=json.loads
+        ) as loads:
+            endpoint = _build_endpoint_mechanical("POST", "/poll", traces)
+        assert loads.call_count == 4  # two distinct bodies, request + response
+        assert endpoint.request.body_schema is not None
+        assert endpoint.request.body_schema["properties"]["status"]["examples"] == [
+            "pending",
+            "done",
+        ]
+        (resp,) = endpoint.responses
+        assert resp.example_body == {"status": "pending"}
+        assert resp.schema_ is not None
+        assert resp.schema_["properties"]["status"]["examples"] == ["pending", "done"]
+
     def test_endpoint_with_path_params(self):
         traces = [
             make_trace("t_0001", "GET", "https://api.example.com/users/123", 200, 1000),